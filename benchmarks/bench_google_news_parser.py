@@ -0,0 +1,66 @@
+"""
+Time the two Google News result-page parsers on the saved HTML fixtures.
+
+Each fixture is padded with the inline scripts, styles and markup a real
+result page carries (about 400 KB) so the numbers reflect production
+pages, and both parsers are checked to return the same results first.
+
+    python benchmarks/bench_google_news_parser.py [--repeat 20]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tradingagents.dataflows import googlenews_utils  # noqa: E402
+
+FIXTURES = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "google_news", "*.html"
+)
+
+
+def padded(content: bytes) -> bytes:
+    scripts = b"".join(
+        b"<script nonce='n'>var v%d='%s';if(a<b&&c>d){}</script><style>.c%d{color:red}</style>"
+        % (i, b"x" * 2000, i)
+        for i in range(150)
+    )
+    filler = b"<div><span>pad</span></div>" * 3000
+    content = content.replace(b"</head>", scripts + b"</head>", 1)
+    return content.replace(b"</body>", filler + b"</body>", 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = [padded(open(path, "rb").read()) for path in sorted(glob.glob(FIXTURES))]
+    size_kb = sum(map(len, pages)) / len(pages) / 1024
+    parsers = {"bs4": googlenews_utils._parse_page_bs4}
+    if googlenews_utils.Selector is not None:
+        parsers["parsel"] = googlenews_utils._parse_page_parsel
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        outputs = {name: [parse(page) for page in pages] for name, parse in parsers.items()}
+    if len({repr(output) for output in outputs.values()}) != 1:
+        raise SystemExit("parsers disagree on the fixtures")
+
+    print(f"{len(pages)} pages, {size_kb:.0f} KB each on average")
+    for name, parse in parsers.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                for page in pages:
+                    parse(page)
+        per_page = (time.perf_counter() - started) / (args.repeat * len(pages))
+        print(f"{name:>7}: {per_page * 1000:.1f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
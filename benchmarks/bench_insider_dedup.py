@@ -0,0 +1,104 @@
+"""
+Time the insider transaction report on a synthetic Finnhub file.
+
+The file holds 10,000 insider_trans entries over 1,000 days with one
+duplicate per day, the shape that made the original `not in` scan over a
+growing list quadratic. The report is built once to warm the Finnhub
+cache, checked against the original de-duplication, then timed with
+both.
+
+    python benchmarks/bench_insider_dedup.py [--entries 10000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tradingagents.dataflows import interface  # noqa: E402
+from tradingagents.dataflows.config import get_config, set_config  # noqa: E402
+from tradingagents.dataflows.finnhub_store import finnhub_json_path  # noqa: E402
+
+END = date(2024, 12, 31)
+
+
+def write_file(data_dir: str, entries: int, days: int) -> None:
+    per_day = max(1, entries // days)
+    data = {}
+    for day in range(days):
+        filed = (END - timedelta(days=day)).isoformat()
+        rows = [
+            {
+                "name": f"INSIDER {day % 97}",
+                "share": 1000 + i,
+                "change": -(i + 1) * 10,
+                "filingDate": filed,
+                "transactionDate": filed,
+                "transactionCode": "S" if i % 2 else "P",
+                "transactionPrice": 100.0 + i / 4,
+            }
+            for i in range(per_day - 1)
+        ]
+        # the same filing repeated on the next day's list
+        data[filed] = rows + [rows[0] if rows else {"name": "INSIDER"}]
+    path = finnhub_json_path("SYNTH", "insider_trans", data_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def original_unique_entries(data):
+    seen_dicts = []
+    for entries in data.values():
+        for entry in entries:
+            if entry not in seen_dicts:
+                seen_dicts.append(entry)
+    return seen_dicts
+
+
+def timed(repeat: int, look_back: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        report = interface.get_finnhub_company_insider_transactions(
+            "SYNTH", END.isoformat(), look_back
+        )
+    return (time.perf_counter() - started) / repeat, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_file(data_dir, args.entries, args.days)
+        config = get_config()
+        config["data_cache_dir"] = os.path.join(data_dir, "cache")
+        set_config(config)
+        interface.DATA_DIR = data_dir
+
+        # warm the Finnhub cache so both runs time only the report
+        interface.get_finnhub_company_insider_transactions("SYNTH", END.isoformat(), args.days)
+        linear = interface._unique_entries
+        after, report = timed(args.repeat, args.days)
+        interface._unique_entries = original_unique_entries
+        try:
+            before, original_report = timed(args.repeat, args.days)
+        finally:
+            interface._unique_entries = linear
+        if report != original_report:
+            raise SystemExit("reports differ between the two de-duplications")
+
+    print(f"{args.entries} entries over {args.days} days, {len(report)} characters")
+    print(f"before: {before:.3f} s")
+    print(f" after: {after:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
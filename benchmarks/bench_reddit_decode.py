@@ -0,0 +1,133 @@
+"""
+Time FieldDecoder on a synthetic Reddit dump with every installed backend.
+
+The dump mimics Pushshift submissions: each line carries the five fields
+the Reddit tools read plus the few dozen metadata fields a real dump
+has, so skipping unread fields matters as it does in production. It is
+written to a temporary file (300 MB by default) and read line by line,
+and the backends are first checked to decode the same fields.
+
+    python benchmarks/bench_reddit_decode.py [--size-mb 300] [--keep PATH]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tradingagents.dataflows import json_codec  # noqa: E402
+from tradingagents.dataflows.reddit_utils import _reddit_post_decoder  # noqa: E402
+
+FIELDS = _reddit_post_decoder.fields
+WORDS = "apple earnings stock market buy sell hold moon rocket dip rally guidance".split()
+
+
+def post(rng: random.Random, i: int) -> dict:
+    text = lambda n: " ".join(rng.choice(WORDS) for _ in range(n))  # noqa: E731
+    return {
+        "id": f"t3_{i:x}",
+        "author": f"user{rng.randrange(100000)}",
+        "created_utc": 1704067200 + i * 7,
+        "title": text(rng.randrange(4, 20)),
+        "selftext": text(rng.randrange(0, 300)),
+        "url": f"https://www.reddit.com/r/stocks/comments/{i:x}/",
+        "ups": rng.randrange(-50, 5000),
+        "downs": 0,
+        "score": rng.randrange(5000),
+        "num_comments": rng.randrange(800),
+        "subreddit": "stocks",
+        "subreddit_id": "t5_2qjfk",
+        "permalink": f"/r/stocks/comments/{i:x}/",
+        "over_18": False,
+        "spoiler": False,
+        "stickied": False,
+        "edited": rng.choice([False, 1704067300.0]),
+        "link_flair_text": rng.choice([None, "Company Discussion", "News"]),
+        "all_awardings": [
+            {"id": "gid_1", "name": "Silver", "count": rng.randrange(3), "coin_price": 100}
+        ],
+        "media": None,
+        "preview": {
+            "images": [
+                {"source": {"url": "https://i.redd.it/x.png", "width": 640, "height": 480}}
+            ],
+            "enabled": True,
+        },
+        "retrieved_on": 1704100000 + i,
+    }
+
+
+def write_dump(path: str, size_mb: int) -> int:
+    rng = random.Random(0)
+    target = size_mb * 1024 * 1024
+    written = lines = 0
+    with open(path, "wb") as f:
+        while written < target:
+            line = json.dumps(post(rng, lines)).encode() + b"\n"
+            f.write(line)
+            written += len(line)
+            lines += 1
+    return lines
+
+
+def decoders() -> dict:
+    backends = ["json"]
+    if json_codec.orjson is not None:
+        backends.insert(0, "orjson")
+    if json_codec.msgspec is not None:
+        backends.insert(0, "msgspec")
+    return {name: json_codec.FieldDecoder(FIELDS, backend=name) for name in backends}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=300)
+    parser.add_argument("--keep", help="write the dump here and keep it, or reuse it if present")
+    args = parser.parse_args()
+
+    if args.keep:
+        path = args.keep
+    else:
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+    try:
+        if not (args.keep and os.path.exists(path)):
+            started = time.perf_counter()
+            write_dump(path, args.size_mb)
+            print(f"wrote {path} in {time.perf_counter() - started:.1f} s")
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        available = decoders()
+        with open(path, "rb") as f:
+            sample = [line for _, line in zip(range(10_000), f)]
+        outputs = {
+            name: [decoder.decode(line) for line in sample]
+            for name, decoder in available.items()
+        }
+        if len({repr(output) for output in outputs.values()}) != 1:
+            raise SystemExit("backends disagree on the dump")
+
+        print(f"{size_mb:.0f} MB dump")
+        for name, decoder in available.items():
+            started = time.perf_counter()
+            lines = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    decoder.decode(line)
+                    lines += 1
+            elapsed = time.perf_counter() - started
+            print(
+                f"{name:>8}: {elapsed:6.2f} s, {size_mb / elapsed:6.0f} MB/s, "
+                f"{lines / elapsed / 1000:6.0f}k lines/s"
+            )
+    finally:
+        if not args.keep:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import pytest
+
+import tradingagents.default_config as default_config
+from tradingagents.dataflows import config as config_module
+
+
+@pytest.fixture
+def dataflow_config(tmp_path, monkeypatch):
+    """Give each test a fresh default config with its caches under tmp_path."""
+    config = default_config.DEFAULT_CONFIG.copy()
+    config["data_cache_dir"] = str(tmp_path / "cache")
+    monkeypatch.setattr(config_module, "_config", config)
+
+    def update(**values):
+        config.update(values)
+        return config
+
+    return update
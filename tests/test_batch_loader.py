@@ -0,0 +1,47 @@
+import pandas as pd
+
+from tradingagents.dataflows.batch_loader import load_price_batch
+from tradingagents.dataflows.price_store import PriceStore
+
+
+def _bars(start, periods):
+    dates = pd.bdate_range(start, periods=periods)
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": 1.0,
+            "High": 1.0,
+            "Low": 1.0,
+            "Close": 1.0,
+            "Volume": 100.0,
+        }
+    )
+
+
+def test_empty_download_is_not_marked_fresh(dataflow_config, tmp_path):
+    dataflow_config()
+    store = PriceStore(str(tmp_path / "prices"))
+    responses = [{}, {"AAPL": _bars("2024-01-02", 5)}]
+
+    def downloader(symbols, start_date, end_date):
+        return responses.pop(0)
+
+    first = load_price_batch(["AAPL"], "2024-01-10", downloader=downloader, store=store)
+    assert first["status"].tolist() == ["empty"]
+    assert not store.exists("AAPL")
+    assert not store.is_refreshed("AAPL", "2024-01-10")
+
+    second = load_price_batch(["AAPL"], "2024-01-10", downloader=downloader, store=store)
+    assert second["status"].tolist() == ["ok"]
+    assert store.is_refreshed("AAPL", "2024-01-10")
+    assert len(store.read("AAPL")) == 5
+
+
+def test_empty_incremental_tail_is_not_marked_fresh(dataflow_config, tmp_path):
+    dataflow_config(price_refresh_mode="incremental")
+    store = PriceStore(str(tmp_path / "prices"))
+    store.replace("AAPL", _bars("2024-01-02", 5), refreshed="2024-01-09")
+
+    store.refresh("AAPL", "2024-01-10", downloader=lambda *args: pd.DataFrame())
+    assert not store.is_refreshed("AAPL", "2024-01-10")
+    assert len(store.read("AAPL")) == 5
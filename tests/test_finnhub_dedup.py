@@ -0,0 +1,98 @@
+import random
+
+from tradingagents.dataflows.interface import _unique_entries
+
+
+def _reference_unique(data):
+    """The original de-duplication: a linear `not in` scan over a growing list."""
+    seen_dicts = []
+    for entries in data.values():
+        for entry in entries:
+            if entry not in seen_dicts:
+                seen_dicts.append(entry)
+    return seen_dicts
+
+
+def _assert_same_entries(data):
+    unique = _unique_entries(data)
+    reference = _reference_unique(data)
+    assert unique == reference
+    # the first occurrence is kept, not an equal copy seen later
+    assert all(a is b for a, b in zip(unique, reference))
+
+
+def test_flat_duplicates_across_days():
+    entry = {"name": "DOE JOHN", "change": -100, "share": 900, "filingDate": "2024-01-03"}
+    _assert_same_entries(
+        {
+            "2024-01-02": [entry, dict(entry, change=-50)],
+            "2024-01-03": [dict(entry), dict(entry, share=800)],
+            "2024-01-04": [dict(entry, change=-50), dict(entry)],
+        }
+    )
+
+
+def test_same_entries_in_a_different_key_order():
+    first = {"year": 2024, "month": 1, "change": 12.0, "mspr": 3.5}
+    reordered = {"mspr": 3.5, "change": 12.0, "month": 1, "year": 2024}
+    data = {"2024-01-31": [first], "2024-02-29": [reordered, {"year": 2024, "month": 2}]}
+    _assert_same_entries(data)
+    assert len(_unique_entries(data)) == 2
+
+
+def test_nested_lists_and_dicts():
+    base = {"symbol": "AAPL", "tags": ["a", "b"], "meta": {"source": "sec", "ids": [1, 2]}}
+    data = {
+        "2024-01-02": [
+            base,
+            {"meta": {"ids": [1, 2], "source": "sec"}, "tags": ["a", "b"], "symbol": "AAPL"},
+            dict(base, tags=["b", "a"]),
+        ],
+        "2024-01-03": [
+            dict(base, meta={"source": "sec", "ids": [1, 2.0]}),
+            dict(base, meta={"source": "sec", "ids": [1, 2, 3]}),
+            dict(base, meta={"source": "sec"}),
+            dict(base, tags=[["a", "b"]]),
+        ],
+    }
+    _assert_same_entries(data)
+
+
+def test_mixed_flat_and_nested_values():
+    data = {
+        "2024-01-02": [{"a": 1}, {"a": [1]}, {"a": 1.0}, {"a": {"b": 1}}],
+        "2024-01-03": [{"a": True}, {"a": [True]}, {"a": {"b": 1.0}}, {"a": "1"}],
+    }
+    _assert_same_entries(data)
+
+
+def _random_value(rng, depth):
+    kind = rng.randrange(6 if depth < 2 else 3)
+    if kind == 0:
+        return rng.choice([0, 1, 1.0, 2, -3.5])
+    if kind == 1:
+        return rng.choice(["S", "P", "", "AAPL"])
+    if kind == 2:
+        return rng.choice([None, True, False])
+    if kind == 3:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(3))]
+    return _random_entry(rng, depth + 1)
+
+
+def _random_entry(rng, depth=0):
+    keys = rng.sample(["name", "change", "share", "code", "meta"], rng.randrange(1, 4))
+    return {key: _random_value(rng, depth) for key in keys}
+
+
+def test_matches_reference_on_random_entries():
+    rng = random.Random(0)
+    pool = [_random_entry(rng) for _ in range(60)]
+    for _ in range(20):
+        data = {}
+        for day in range(rng.randrange(1, 8)):
+            picked = [rng.choice(pool) for _ in range(rng.randrange(6))]
+            # equal copies with shuffled key order
+            data[f"2024-01-{day + 1:02d}"] = [
+                dict(rng.sample(list(entry.items()), len(entry))) for entry in picked
+            ]
+        _assert_same_entries(data)
@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from tradingagents.dataflows import googlenews_utils
+from tradingagents.dataflows.rate_limiter import TokenBucket
+
+
+def _page_html(page, pages):
+    items = "".join(
+        f'<div class="SoaBEf"><a href="https://news.example.com/{page}-{i}">'
+        f'<div class="NUnG9d"><span>Source {i}</span></div>'
+        f'<div class="MBeuO">Title {page}-{i}</div>'
+        f'<div class="GI74Re">Snippet {page}-{i}</div>'
+        f'<div class="LfVVr">{i} hours ago</div></a></div>'
+        for i in range(10)
+    )
+    next_link = '<a id="pnnext" href="#">Next</a>' if page < pages - 1 else ""
+    return f"<html><body>{items}{next_link}</body></html>"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves `server.pages` pages of Google News-like results, 10 per page."""
+
+    def do_GET(self):
+        page = int(parse_qs(urlparse(self.path).query)["start"][0]) // 10
+        self.server.requested.append(page)
+        time.sleep(self.server.latency)
+        if page < self.server.pages:
+            body = _page_html(page, self.server.pages).encode()
+        else:
+            body = b"<html><body></body></html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def news_server(dataflow_config, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.pages = 3
+    server.latency = 0.05
+    server.requested = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    dataflow_config(
+        google_news_url=f"http://127.0.0.1:{server.server_port}/search",
+        google_news_cache=False,
+        google_news_rate=100.0,
+        google_news_burst=100,
+    )
+    monkeypatch.setattr(googlenews_utils, "_rate_limiter", None)
+    # the serial mode's anti-detection sleep is not under test
+    monkeypatch.setattr(googlenews_utils.random, "uniform", lambda a, b: 0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_concurrent_matches_serial(news_server, dataflow_config):
+    dataflow_config(google_news_mode="serial")
+    serial = googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    dataflow_config(google_news_mode="concurrent")
+    concurrent = googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    assert len(serial) == 30
+    assert concurrent == serial
+
+
+def test_default_never_requests_past_the_last_page(news_server, dataflow_config):
+    dataflow_config(google_news_mode="concurrent")
+    googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    assert news_server.requested == [0, 1, 2]
+
+
+def test_prefetch_is_capped_by_concurrency(news_server, dataflow_config):
+    news_server.pages = 6
+    dataflow_config(
+        google_news_mode="concurrent",
+        google_news_prefetch_pages=8,
+        google_news_concurrency=3,
+    )
+    results = googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    assert [r["title"] for r in results] == [
+        f"Title {page}-{i}" for page in range(6) for i in range(10)
+    ]
+    # page 0, then rounds of three: 1-3 and 4-6
+    assert sorted(news_server.requested) == list(range(7))
+
+
+def test_rate_limiter_paces_requests(news_server, dataflow_config):
+    news_server.latency = 0.0
+    news_server.pages = 5
+    dataflow_config(google_news_mode="concurrent", google_news_rate=10.0, google_news_burst=1)
+    started = time.monotonic()
+    googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    # five requests at 10/s with a burst of one need at least 0.4 s
+    assert time.monotonic() - started >= 0.39
+
+
+def test_cache_is_keyed_by_url_and_parser(news_server, dataflow_config):
+    if googlenews_utils.Selector is None:
+        pytest.skip("parsel is not installed")
+    dataflow_config(google_news_mode="serial", google_news_cache=True, google_news_parser="bs4")
+    first = googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    googlenews_utils.getNewsData("aapl", "01/01/2024", "01/07/2024")
+    assert news_server.requested == [0, 1, 2]
+
+    dataflow_config(google_news_parser="parsel")
+    assert googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07") == first
+    assert news_server.requested == [0, 1, 2] * 2
+
+    # the same server under another URL is another endpoint
+    url = f"http://localhost:{news_server.server_port}/search"
+    dataflow_config(google_news_url=url)
+    googlenews_utils.getNewsData("AAPL", "2024-01-01", "2024-01-07")
+    assert news_server.requested == [0, 1, 2] * 3
+
+
+def test_token_bucket_reserves_in_order():
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert 0 < waits[2] <= 0.05 + 1e-3
+    assert bucket.acquired == 4
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "google_news")
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    "name, results, has_next",
+    [
+        ("results_page.html", 10, True),
+        ("last_page.html", 4, False),
+        ("broken_page.html", 3, True),
+        ("empty_page.html", 0, False),
+    ],
+)
+def test_parsel_parser_matches_bs4(name, results, has_next, capsys):
+    pytest.importorskip("parsel")
+    content = _fixture(name)
+
+    expected = googlenews_utils._parse_page_bs4(content)
+    expected_log = capsys.readouterr().out
+    parsed = googlenews_utils._parse_page_parsel(content)
+    parsed_log = capsys.readouterr().out
+
+    assert parsed == expected
+    assert parsed_log == expected_log
+    assert len(parsed[0]) == results and parsed[1] is has_next
+
+
+def test_broken_results_are_skipped(capsys):
+    results, _ = googlenews_utils._parse_page_bs4(_fixture("broken_page.html"))
+    log = capsys.readouterr().out
+    # no <a>, no href, and each of title, snippet, date and source missing in turn
+    assert log.count("Error processing result:") == 7
+    assert [r["link"].rsplit("/", 1)[-1] for r in results] == [
+        "20?a=1&b=2",
+        "27?a=1&b=2",
+        "unclosed",
+    ]
+    # the first match of each field wins, as with select_one
+    assert results[1]["date"] == "27 days ago" and results[1]["source"] == "Reuters"
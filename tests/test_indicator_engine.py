@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from stockstats import wrap
+
+from tradingagents.dataflows.indicator_engine import SUPPORTED_INDICATORS, compute_indicators
+
+INDICATORS = sorted(SUPPORTED_INDICATORS)
+
+
+def _random_walk(length, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, length)))
+    spread = np.abs(rng.normal(0, 0.01, length)) * close
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2000-01-03", periods=length),
+            "Open": close + rng.normal(0, 0.5, length),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, length).astype(float),
+        }
+    )
+
+
+def _assert_matches_stockstats(data):
+    expected = wrap(data.copy())
+    actual = compute_indicators(data, INDICATORS)
+    for indicator in INDICATORS:
+        np.testing.assert_allclose(
+            actual[indicator].to_numpy(),
+            expected[indicator].to_numpy(dtype=float),
+            rtol=1e-9,
+            atol=1e-9,
+            equal_nan=True,
+            err_msg=indicator,
+        )
+
+
+@pytest.mark.parametrize("length", [1, 2, 13, 27, 60, 250, 3800])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_random_walks_match_stockstats(length, seed):
+    _assert_matches_stockstats(_random_walk(length, seed))
+
+
+def test_flat_close_matches_stockstats():
+    data = _random_walk(300, 2)
+    data.loc[100:160, ["Open", "High", "Low", "Close"]] = 50.0
+    _assert_matches_stockstats(data)
+
+
+def test_constant_series_matches_stockstats():
+    data = _random_walk(80, 4)
+    data[["Open", "High", "Low", "Close"]] = 10.0
+    _assert_matches_stockstats(data)
+
+
+def test_zero_volume_matches_stockstats():
+    data = _random_walk(300, 3)
+    data.loc[[0, 5, 150], "Volume"] = 0.0
+    data.loc[200:230, "Volume"] = 0.0
+    _assert_matches_stockstats(data)
+
+
+def test_unsupported_indicator_raises():
+    with pytest.raises(ValueError):
+        compute_indicators(_random_walk(10, 0), ["kdjk"])
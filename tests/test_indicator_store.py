@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import indicator_store
+from tradingagents.dataflows.indicator_store import IndicatorStore, file_signature
+
+
+@pytest.fixture
+def store(dataflow_config, monkeypatch):
+    monkeypatch.setattr(indicator_store, "_fingerprints", {})
+    return IndicatorStore()
+
+
+@pytest.fixture
+def prices(tmp_path):
+    dates = pd.bdate_range("2024-01-02", periods=40)
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, len(dates)))
+    data = pd.DataFrame({"Date": dates, "Close": close, "Volume": np.arange(len(dates)) * 10.0})
+    path = tmp_path / "AAPL.csv"
+    data.to_csv(path, index=False)
+    return data, str(path)
+
+
+def _compute(calls):
+    def compute(data, indicators):
+        calls.append(list(indicators))
+        index = pd.DatetimeIndex(data["Date"], name="Date")
+        return pd.DataFrame(
+            {indicator: data["Close"].to_numpy() * (i + 1) for i, indicator in enumerate(indicators)},
+            index=index,
+        )
+
+    return compute
+
+
+def test_fingerprint_depends_on_row_order_and_indicators(prices):
+    data, _ = prices
+    fingerprint = IndicatorStore.fingerprint(data, ["rsi", "macd"])
+    assert fingerprint == IndicatorStore.fingerprint(data.copy(), ["macd", "rsi"])
+    assert fingerprint != IndicatorStore.fingerprint(data, ["rsi"])
+    # the same rows in another order; a sum of row hashes cannot tell them apart
+    reordered = data.iloc[::-1]
+    assert fingerprint != IndicatorStore.fingerprint(reordered, ["rsi", "macd"])
+    swapped = data.copy()
+    swapped.loc[[0, 1], "Close"] = swapped.loc[[1, 0], "Close"].to_numpy()
+    assert fingerprint != IndicatorStore.fingerprint(swapped, ["rsi", "macd"])
+
+
+def test_matrix_is_rebuilt_when_indicators_change(store, prices):
+    data, _ = prices
+    calls = []
+    matrix = store.get_matrix("AAPL", "test", data, ["rsi"], _compute(calls))
+    assert list(matrix.columns) == ["rsi"]
+    store.get_matrix("AAPL", "test", data, ["rsi"], _compute(calls))
+    assert calls == [["rsi"]]
+
+    matrix = store.get_matrix("AAPL", "test", data, ["rsi", "macd"], _compute(calls))
+    assert list(matrix.columns) == ["rsi", "macd"]
+    assert calls == [["rsi"], ["rsi", "macd"]]
+
+
+def test_matrix_is_rebuilt_when_prices_change(store, prices):
+    data, _ = prices
+    calls = []
+    store.get_matrix("AAPL", "test", data, ["rsi"], _compute(calls))
+    changed = data.copy()
+    changed.loc[len(changed) - 1, "Close"] += 1
+    matrix = store.get_matrix("AAPL", "test", changed, ["rsi"], _compute(calls))
+    assert len(calls) == 2
+    assert matrix["rsi"].iloc[-1] == changed["Close"].iloc[-1]
+
+
+def test_fingerprint_is_hashed_once_per_version_of_the_price_file(store, prices, monkeypatch):
+    data, path = prices
+    hashed = []
+    original = IndicatorStore.fingerprint
+    monkeypatch.setattr(
+        IndicatorStore,
+        "fingerprint",
+        staticmethod(lambda data, indicators: hashed.append(1) or original(data, indicators)),
+    )
+    calls = []
+    for _ in range(3):
+        store.get_matrix(
+            "AAPL", "test", data, ["rsi"], _compute(calls), path, file_signature(path)
+        )
+    assert len(hashed) == 1 and len(calls) == 1
+
+    changed = data.copy()
+    changed.loc[0, "Close"] += 1
+    changed.to_csv(path, index=False)
+    signature = file_signature(path)
+    for _ in range(2):
+        store.get_matrix("AAPL", "test", changed, ["rsi"], _compute(calls), path, signature)
+    assert len(hashed) == 2 and len(calls) == 2
+
+
+def test_file_signature_of_a_missing_file(tmp_path):
+    assert file_signature(str(tmp_path / "missing.csv")) is None
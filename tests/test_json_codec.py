@@ -0,0 +1,103 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+from tradingagents.dataflows import json_codec
+
+FIELDS = ("created_utc", "title", "selftext", "url", "ups")
+
+POSTS = [
+    {
+        "created_utc": 1704153600,
+        "title": "AAPL beats estimates",
+        "selftext": "",
+        "url": "https://example.com/a",
+        "ups": 12,
+        "author": "someone",
+        "all_awardings": [{"name": "gold", "count": 1}],
+    },
+    {
+        "url": None,
+        "ups": -3,
+        "selftext": "Unicode é中文 and \"quotes\"\n\\ too",
+        "title": "Nested {\"title\": \"not this one\"}",
+        "created_utc": "1704240000.0",
+        "media": {"title": "nor this", "ups": 999},
+    },
+    {
+        "created_utc": 1.7043264e9,
+        "title": "x" * 5000,
+        "selftext": "🚀 to the moon",
+        "url": "",
+        "ups": 0,
+        "edited": False,
+    },
+]
+
+MALFORMED = [
+    b"",
+    b"{",
+    b'{"created_utc": 1, "title": "a"',
+    b'{"created_utc": 1} trailing',
+    b'{"created_utc": NaN, "title": "", "selftext": "", "url": "", "ups": 0}',
+    b'{"created_utc": Infinity, "title": "", "selftext": "", "url": "", "ups": 0}',
+    b'{"created_utc": 1, "title": "\xff", "selftext": "", "url": "", "ups": 0}',
+    b"[1, 2, 3]",
+    b"null",
+    b'"a string"',
+]
+
+
+@pytest.fixture(params=["msgspec", "orjson", "json"])
+def codec(request, monkeypatch):
+    """json_codec re-imported with only the requested backend importable."""
+    backend = request.param
+    if backend != "json":
+        pytest.importorskip(backend)
+    for name in ("orjson", "msgspec"):
+        if name != backend:
+            monkeypatch.setitem(sys.modules, name, None)
+    module = importlib.reload(json_codec)
+    assert module.JSON_BACKEND == backend
+    yield module
+    monkeypatch.undo()
+    importlib.reload(json_codec)
+
+
+def _lines():
+    return [json.dumps(post).encode() + b"\n" for post in POSTS]
+
+
+def test_decoder_uses_the_only_installed_backend(codec):
+    assert codec.FieldDecoder(FIELDS).backend == codec.JSON_BACKEND
+
+
+def test_every_backend_decodes_the_same_fields(codec):
+    decoder = codec.FieldDecoder(FIELDS)
+    for post, line in zip(POSTS, _lines()):
+        expected = {field: post[field] for field in FIELDS}
+        assert decoder.decode(line) == expected
+        assert decoder.decode(line.decode()) == expected
+    assert [codec.loads(line) for line in _lines()] == POSTS
+
+
+def test_missing_field_raises_key_error_with_its_name(codec):
+    decoder = codec.FieldDecoder(FIELDS)
+    line = json.dumps({field: 1 for field in FIELDS if field != "url"}).encode()
+    with pytest.raises(KeyError) as excinfo:
+        decoder.decode(line)
+    assert excinfo.value.args == ("url",)
+
+
+def test_null_field_is_not_missing(codec):
+    decoder = codec.FieldDecoder(("url",))
+    assert decoder.decode(b'{"url": null}') == {"url": None}
+
+
+@pytest.mark.parametrize("line", MALFORMED)
+def test_malformed_line_raises_value_error(codec, line):
+    decoder = codec.FieldDecoder(FIELDS)
+    with pytest.raises(ValueError):
+        decoder.decode(line)
@@ -0,0 +1,185 @@
+import json
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import tradingagents.dataflows.interface as interface
+
+
+class FakeResponsesHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the Responses API: answers with the start of the prompt."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["input"][0]["content"][0]["text"]
+        with self.server.lock:
+            self.server.prompts.append(prompt)
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.active -= 1
+        payload = {
+            "id": "resp_1",
+            "object": "response",
+            "created_at": 0,
+            "model": body["model"],
+            "status": "completed",
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "output": [
+                {
+                    "type": "web_search_call",
+                    "id": "ws_1",
+                    "status": "completed",
+                    "action": {"type": "search", "query": "q"},
+                },
+                {
+                    "type": "message",
+                    "id": "msg_1",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [
+                        {"type": "output_text", "text": f"answer: {prompt[:16]}", "annotations": []}
+                    ],
+                },
+            ],
+        }
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def responses_api(dataflow_config, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeResponsesHandler)
+    server.prompts = []
+    server.latency = 0.0
+    server.lock = threading.Lock()
+    server.active = server.max_active = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    dataflow_config(backend_url=f"http://127.0.0.1:{server.server_port}/v1")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_historical_answers_are_reused(responses_api):
+    first = interface.get_stock_news_openai("AAPL", "2024-05-10")
+    second = interface.get_stock_news_openai("AAPL", "2024-05-10")
+    assert first == second and first.startswith("answer: ")
+    assert len(responses_api.prompts) == 1
+
+    interface.get_stock_news_openai("MSFT", "2024-05-10")
+    interface.get_fundamentals_openai("AAPL", "2024-05-10")
+    assert len(responses_api.prompts) == 3
+
+
+def test_global_news_is_fetched_once_for_concurrent_tickers(responses_api):
+    responses_api.latency = 0.2
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(interface.get_global_news_openai("2024-05-10")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == 1 and len(results) == 5
+    assert len(responses_api.prompts) == 1
+
+
+def test_model_change_misses(responses_api, dataflow_config):
+    interface.get_global_news_openai("2024-05-10")
+    dataflow_config(quick_think_llm="another-model")
+    interface.get_global_news_openai("2024-05-10")
+    assert len(responses_api.prompts) == 2
+
+
+def test_today_expires_with_ttl(responses_api, dataflow_config):
+    dataflow_config(openai_cache_ttl=0)
+    today = date.today().isoformat()
+    interface.get_global_news_openai(today)
+    interface.get_global_news_openai(today)
+    assert len(responses_api.prompts) == 2
+
+
+def test_unparsable_date_returns_the_answer(responses_api, dataflow_config):
+    text = interface.get_global_news_openai("2024/05/10")
+    assert text.startswith("answer: ")
+    assert interface.get_global_news_openai("2024/05/10") == text
+    assert len(responses_api.prompts) == 1
+
+    # cached with the TTL rather than permanently
+    dataflow_config(openai_cache_ttl=0)
+    interface.get_global_news_openai("2024/05/11")
+    interface.get_global_news_openai("2024/05/11")
+    assert len(responses_api.prompts) == 3
+
+
+def test_cache_disabled_always_calls(responses_api, dataflow_config):
+    dataflow_config(openai_cache=False)
+    interface.get_global_news_openai("2024-05-10")
+    interface.get_global_news_openai("2024-05-10")
+    assert len(responses_api.prompts) == 2
+
+
+def _run_concurrently(*calls):
+    results = [None] * len(calls)
+
+    def run(i, call):
+        results[i] = call()
+
+    threads = [threading.Thread(target=run, args=(i, call)) for i, call in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_different_keys_run_in_parallel(responses_api):
+    responses_api.latency = 0.5
+    started = time.monotonic()
+    aapl, msft = _run_concurrently(
+        lambda: interface.get_stock_news_openai("AAPL", "2024-05-10"),
+        lambda: interface.get_stock_news_openai("MSFT", "2024-05-10"),
+    )
+    assert aapl != msft
+    assert len(responses_api.prompts) == 2
+    assert responses_api.max_active == 2
+    assert time.monotonic() - started < 0.9
+
+
+def test_identical_keys_make_one_call(responses_api):
+    responses_api.latency = 0.3
+    first, second = _run_concurrently(
+        lambda: interface.get_fundamentals_openai("AAPL", "2024-05-10"),
+        lambda: interface.get_fundamentals_openai("AAPL", "2024-05-10"),
+    )
+    assert first == second
+    assert len(responses_api.prompts) == 1
+    assert not interface._openai_inflight
+
+
+def test_cache_disabled_does_not_wait(responses_api, dataflow_config):
+    dataflow_config(openai_cache=False)
+    responses_api.latency = 0.3
+    _run_concurrently(
+        lambda: interface.get_global_news_openai("2024-05-10"),
+        lambda: interface.get_global_news_openai("2024-05-10"),
+    )
+    assert len(responses_api.prompts) == 2
+    assert responses_api.max_active == 2
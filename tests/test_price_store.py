@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.price_cache import get_price_cache
+from tradingagents.dataflows.price_store import LocalCSVDownloader, PriceStore
+
+CSV_NAME = "AAPL-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+def _write_csv(directory, start, end, scale=1.0):
+    dates = pd.bdate_range(start, end)
+    close = (100 + np.arange(len(dates), dtype=float)) * scale
+    pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close - 0.5,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": 1_000_000.0,
+        }
+    ).to_csv(directory / CSV_NAME, index=False)
+
+
+@pytest.fixture
+def setup(dataflow_config, tmp_path):
+    dataflow_config(price_refresh_mode="incremental", price_history_years=15)
+    get_price_cache().clear()
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    return PriceStore(str(tmp_path / "prices")), LocalCSVDownloader(str(csv_dir)), csv_dir
+
+
+def test_cold_refresh_downloads_the_full_history(setup):
+    store, downloader, csv_dir = setup
+    _write_csv(csv_dir, "2023-01-02", "2023-12-29")
+
+    added = store.refresh("AAPL", "2024-01-01", downloader=downloader)
+
+    assert downloader.calls == [("AAPL", "2009-01-01", "2024-01-01")]
+    assert added == len(pd.bdate_range("2023-01-02", "2023-12-29"))
+    assert store.is_refreshed("AAPL", "2024-01-01")
+
+
+def test_incremental_refresh_appends_after_the_last_bar(setup):
+    store, downloader, csv_dir = setup
+    _write_csv(csv_dir, "2023-01-02", "2023-12-29")
+    store.refresh("AAPL", "2024-01-01", downloader=downloader)
+    _write_csv(csv_dir, "2023-01-02", "2024-01-31")
+
+    added = store.refresh("AAPL", "2024-02-01", downloader=downloader)
+
+    # the tail starts at the last stored bar so its close can be compared
+    assert downloader.calls[-1] == ("AAPL", "2023-12-29", "2024-02-01")
+    assert added == len(pd.bdate_range("2024-01-01", "2024-01-31"))
+    stored = store.read("AAPL")
+    assert stored.index.is_unique and stored.index.is_monotonic_increasing
+    assert stored.index[-1] == pd.Timestamp("2024-01-31")
+    assert store.is_refreshed("AAPL", "2024-02-01")
+
+
+def test_close_mismatch_downloads_the_full_history_again(setup):
+    store, downloader, csv_dir = setup
+    _write_csv(csv_dir, "2023-01-02", "2023-12-29")
+    store.refresh("AAPL", "2024-01-01", downloader=downloader)
+    # a split re-adjusted every close
+    _write_csv(csv_dir, "2023-01-02", "2024-01-31", scale=0.5)
+
+    store.refresh("AAPL", "2024-02-01", downloader=downloader)
+
+    assert downloader.calls[1:] == [
+        ("AAPL", "2023-12-29", "2024-02-01"),
+        ("AAPL", "2009-02-01", "2024-02-01"),
+    ]
+    stored = store.read("AAPL")
+    assert stored["Close"].iloc[0] == 50.0
+    assert stored.index[-1] == pd.Timestamp("2024-01-31")
+
+
+def test_empty_tail_returns_zero_and_stays_unrefreshed(setup):
+    store, downloader, csv_dir = setup
+    _write_csv(csv_dir, "2023-01-02", "2023-12-29")
+    store.refresh("AAPL", "2024-01-01", downloader=downloader)
+    (csv_dir / CSV_NAME).unlink()
+
+    added = store.refresh("AAPL", "2024-02-01", downloader=downloader)
+
+    assert added == 0
+    assert downloader.calls[-1] == ("AAPL", "2023-12-29", "2024-02-01")
+    assert not store.is_refreshed("AAPL", "2024-02-01")
+    assert store.metadata("AAPL")["refreshed"] == "2024-01-01"
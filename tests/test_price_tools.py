@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import tradingagents.dataflows.interface as interface
+from tradingagents.dataflows.price_cache import format_price_frame, get_price_cache
+
+OFFLINE_CSV = "AAPL-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+@pytest.fixture
+def price_csv(dataflow_config, tmp_path, monkeypatch):
+    """A YFin CSV whose Date strings carry UTC offsets, as downloaded from Yahoo Finance."""
+    dates = pd.date_range("2024-01-02", "2024-04-30", freq="B", tz="America/New_York")
+    rng = np.random.default_rng(0)
+    close = 180 + np.cumsum(rng.normal(0, 1, len(dates)))
+    frame = pd.DataFrame(
+        {
+            "Date": dates.astype(str),
+            "Open": close + 0.5,
+            "High": close + 1.25,
+            "Low": close - 1.0,
+            "Close": close,
+            "Adj Close": close * 0.99,
+            "Volume": rng.integers(1_000_000, 5_000_000, len(dates)),
+        }
+    )
+    directory = tmp_path / "data" / "market_data" / "price_data"
+    directory.mkdir(parents=True)
+    path = directory / OFFLINE_CSV
+    frame.to_csv(path, index=False)
+    monkeypatch.setattr(interface, "DATA_DIR", str(tmp_path / "data"))
+    get_price_cache().clear()
+    return path
+
+
+def _reference_rows(path, start_date, end_date):
+    """The original string-mask filter over the raw CSV."""
+    data = pd.read_csv(path)
+    data["DateOnly"] = data["Date"].str[:10]
+    filtered = data[(data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)]
+    return filtered.drop("DateOnly", axis=1)
+
+
+def test_window_keeps_date_strings_and_row_numbers(price_csv):
+    report = interface.get_YFin_data_window("AAPL", "2024-03-15", 30)
+    expected = _reference_rows(price_csv, "2024-02-14", "2024-03-15")
+    assert "-05:00" in report and "-04:00" in report
+    assert report.endswith(format_price_frame(expected))
+    assert expected.index[0] > 0
+
+
+def test_get_yfin_data_matches_original_rows(price_csv):
+    data = interface.get_YFin_data("AAPL", "2024-01-10", "2024-02-20")
+    expected = _reference_rows(price_csv, "2024-01-10", "2024-02-20").reset_index(drop=True)
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_get_yfin_data_rejects_dates_past_the_offline_range(price_csv):
+    with pytest.raises(
+        ValueError,
+        match="2025-04-01 is outside of the data range of 2015-01-01 to 2025-03-25",
+    ):
+        interface.get_YFin_data("AAPL", "2025-01-01", "2025-04-01")
+
+
+def test_get_yfin_data_accepts_the_last_offline_date(price_csv):
+    data = interface.get_YFin_data("AAPL", "2024-04-01", "2025-03-25")
+    assert data["Date"].str[:10].tolist()[-1] == "2024-04-30"
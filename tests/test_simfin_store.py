@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import simfin_store
+from tradingagents.dataflows.price_cache import get_price_cache
+from tradingagents.dataflows.simfin_store import load_simfin_store, simfin_csv_path
+
+
+def _write_csv(data_dir, revenue):
+    rows = [
+        {
+            "Ticker": ticker,
+            "Report Date": f"{year}-12-31",
+            "Publish Date": f"{year + 1}-02-{day:02d}",
+            "Revenue": revenue + year,
+        }
+        for ticker, day in (("AAPL", 1), ("MSFT", 15))
+        for year in range(2018, 2024)
+    ]
+    path = simfin_csv_path("income_statements", "annual", str(data_dir))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pd.DataFrame(rows).to_csv(path, sep=";", index=False)
+    return path
+
+
+@pytest.fixture
+def data_dir(dataflow_config, tmp_path):
+    get_price_cache().clear()
+    _write_csv(tmp_path / "data", 0)
+    return tmp_path / "data"
+
+
+def test_latest_and_as_of(data_dir):
+    store = load_simfin_store("income_statements", "annual", str(data_dir))
+    latest = store.latest("income_statements", "annual", "AAPL", "2021-06-30")
+    assert latest["Revenue"] == 2020
+    assert store.latest("income_statements", "annual", "AAPL", "2019-01-31") is None
+    assert store.read("income_statements", "annual", "NOPE").empty
+
+    as_of = store.as_of("income_statements", "annual", "MSFT", ["2024-03-01", "2019-02-14"])
+    assert as_of["Revenue"].iloc[0] == 2023
+    assert pd.isna(as_of["Revenue"].iloc[1])
+
+
+def test_changed_csv_is_ingested_again(data_dir):
+    store = load_simfin_store("income_statements", "annual", str(data_dir))
+    assert store.latest("income_statements", "annual", "AAPL", "2030-01-01")["Revenue"] == 2023
+
+    path = _write_csv(data_dir, 1000)
+    os.utime(path, ns=(0, 0))
+    assert not store.is_ingested("income_statements", "annual", str(data_dir))
+    store = load_simfin_store("income_statements", "annual", str(data_dir))
+    assert store.latest("income_statements", "annual", "AAPL", "2030-01-01")["Revenue"] == 3023
+    # no staging or retired partitions are left behind
+    assert os.listdir(store.root) == ["income_statements-annual"]
+
+
+def test_reads_never_miss_partitions_during_ingest(data_dir, monkeypatch):
+    store = load_simfin_store("income_statements", "annual", str(data_dir))
+    replace = os.replace
+
+    def slow_replace(src, dst):
+        # widen the window between retiring the old partitions and moving in the new ones
+        replace(src, dst)
+        if os.path.isdir(dst):
+            time.sleep(0.005)
+
+    monkeypatch.setattr(simfin_store.os, "replace", slow_replace)
+    stop = threading.Event()
+    misses = []
+
+    def read():
+        while not stop.is_set():
+            if store.read("income_statements", "annual", "AAPL").empty:
+                misses.append(1)
+            if not store.is_ingested("income_statements", "annual", str(data_dir)):
+                misses.append(1)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for _ in range(10):
+            store.ingest("income_statements", "annual", str(data_dir))
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+    assert misses == []
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.trading_calendar import TradingCalendar, get_trading_calendar
+
+# the first weeks of 2024: New Year's Day and MLK Day are holidays
+SESSIONS = pd.DatetimeIndex(
+    [d for d in pd.bdate_range("2024-01-02", "2024-01-31") if d != pd.Timestamp("2024-01-15")],
+    name="Date",
+)
+
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar.from_dates(SESSIONS)
+
+
+def test_single_session(calendar):
+    start, stop = calendar.positions("2024-01-03", "2024-01-03")
+    assert (start, stop) == (1, 2)
+
+
+@pytest.mark.parametrize("date", ["2024-01-06", "2024-01-07", "2024-01-15"])
+def test_weekend_or_holiday_is_empty(calendar, date):
+    start, stop = calendar.positions(date, date)
+    assert stop == start
+
+
+def test_range_around_a_holiday_skips_it(calendar):
+    start, stop = calendar.positions("2024-01-13", "2024-01-16")
+    assert list(SESSIONS[start:stop]) == [pd.Timestamp("2024-01-16")]
+
+
+def test_dates_before_the_first_session(calendar):
+    assert calendar.positions("2023-12-01", "2023-12-31") == (0, 0)
+    assert calendar.positions("2023-12-01", "2024-01-03") == (0, 2)
+
+
+def test_dates_after_the_last_session(calendar):
+    assert calendar.positions("2024-02-01", "2024-03-01") == (len(SESSIONS), len(SESSIONS))
+    assert calendar.positions("2024-01-31", "2024-03-01") == (len(SESSIONS) - 1, len(SESSIONS))
+
+
+def test_timezone_aware_dates_use_their_calendar_day():
+    calendar = TradingCalendar.from_dates(SESSIONS.tz_localize("America/New_York"))
+    assert len(calendar) == len(SESSIONS)
+    assert calendar.positions(pd.Timestamp("2024-01-03 16:00", tz="America/New_York"), "2024-01-03") == (1, 2)
+
+
+def test_calendar_is_rebuilt_when_the_data_grows():
+    first = get_trading_calendar("TEST", "calendar-test", SESSIONS)
+    assert get_trading_calendar("test", "calendar-test", SESSIONS) is first
+    grown = SESSIONS.append(pd.DatetimeIndex(["2024-02-01"]))
+    assert len(get_trading_calendar("TEST", "calendar-test", grown)) == len(SESSIONS) + 1
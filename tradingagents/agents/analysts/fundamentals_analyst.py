@@ -13,6 +13,7 @@ def create_fundamentals_analyst(llm, toolkit):
             tools = [toolkit.get_fundamentals_openai]
         else:
             tools = [
+                toolkit.get_fundamentals_snapshot,
                 toolkit.get_finnhub_company_insider_sentiment,
                 toolkit.get_finnhub_company_insider_transactions,
                 toolkit.get_simfin_balance_sheet,
@@ -22,6 +23,7 @@ def create_fundamentals_analyst(llm, toolkit):
 
         system_message = (
             "您是一位研究員，負責分析過去一週關於一家公司的基本面資訊。請撰寫一份全面的公司基本面資訊報告，包括財務文件、公司簡介、基本公司財務、公司財務歷史、內部人士情緒和內部交易，以獲得對公司基本面資訊的完整視角，以幫助交易者做出決策。請確保包含盡可能多的細節。不要簡單地說趨勢是混合的，提供詳細和細緻的分析和見解，這可能有助於交易者做出決策。"
+            + "如果可以使用 get_fundamentals_snapshot，請優先以一次調用取得內部人士資料和所有財務報表，而不是分別調用各個工具。"
             + "請確保在報告末尾附加一個 Markdown 表格，以組織報告中的關鍵點，組織清晰且易於閱讀。",
         )
 
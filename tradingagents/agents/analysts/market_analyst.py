@@ -14,11 +14,13 @@ def create_market_analyst(llm, toolkit):
             tools = [
                 toolkit.get_YFin_data_online,
                 toolkit.get_stockstats_indicators_report_online,
+                toolkit.get_stockstats_indicators_batch_report_online,
             ]
         else:
             tools = [
                 toolkit.get_YFin_data,
                 toolkit.get_stockstats_indicators_report,
+                toolkit.get_stockstats_indicators_batch_report,
             ]
 
         system_message = (
@@ -46,7 +48,7 @@ MACD 相關：
 成交量基礎指標：
 - vwma: VWMA：按成交量加權的移動平均線。用途：通過整合價格行為與成交量數據來確認趨勢。提示：注意成交量激增造成的偏斜結果；與其他成交量分析結合使用。
 
-- 選擇提供多樣化和互補資訊的指標。避免冗餘（例如，不要同時選擇 rsi 和 stochrsi）。同時簡要解釋為什麼它們適合給定的市場環境。當您進行工具調用時，請使用上面提供的指標的確切名稱，因為它們是定義的參數，否則您的調用將失敗。請確保首先調用 get_YFin_data 來檢索生成指標所需的 CSV。撰寫一份非常詳細和細緻的趨勢觀察報告。不要簡單地說趨勢是混合的，提供詳細和細緻的分析和見解，這可能有助於交易者做出決策。"""
+- 選擇提供多樣化和互補資訊的指標。避免冗餘（例如，不要同時選擇 rsi 和 stochrsi）。同時簡要解釋為什麼它們適合給定的市場環境。當您進行工具調用時，請使用上面提供的指標的確切名稱，因為它們是定義的參數，否則您的調用將失敗。選定多個指標時，請使用名稱含有 batch 的批次指標工具，在一次調用中傳入所有指標名稱的列表。請確保首先調用 get_YFin_data 來檢索生成指標所需的 CSV。撰寫一份非常詳細和細緻的趨勢觀察報告。不要簡單地說趨勢是混合的，提供詳細和細緻的分析和見解，這可能有助於交易者做出決策。"""
             + """ 請確保在報告末尾附加一個 Markdown 表格，以組織報告中的關鍵點，組織清晰且易於閱讀。"""
         )
 
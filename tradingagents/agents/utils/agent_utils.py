@@ -138,7 +138,7 @@ class Toolkit:
 
         result_data = interface.get_YFin_data(symbol, start_date, end_date)
 
-        return result_data
+        return interface.format_price_frame(result_data)
 
     @staticmethod
     @tool
@@ -219,6 +219,64 @@ class Toolkit:
 
         return result_stockstats
 
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in one call.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A formatted report with one section per requested indicator for the specified ticker symbol.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_window_batch(
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in one call.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A formatted report with one section per requested indicator for the specified ticker symbol.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_window_batch(
+            symbol, indicators, curr_date, look_back_days, True
+        )
+
+        return result_stockstats
+
     @staticmethod
     @tool
     def get_finnhub_company_insider_sentiment(
@@ -341,6 +399,30 @@ class Toolkit:
 
         return data_income_stmt
 
+    @staticmethod
+    @tool
+    def get_fundamentals_snapshot(
+        ticker: Annotated[str, "ticker symbol"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve all fundamentals of a company in one call: insider sentiment and insider transactions for the past 30 days, and the most recent balance sheet, cash flow statement and income statement.
+        Args:
+            ticker (str): ticker symbol of the company
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+            str: a combined report of the company's insider activity and most recent financial statements
+        """
+
+        data_snapshot = interface.get_fundamentals_snapshot(ticker, freq, curr_date, 30)
+
+        return data_snapshot
+
     @staticmethod
     @tool
     def get_google_news(
@@ -1,6 +1,6 @@
 import chromadb
 from chromadb.config import Settings
-from openai import OpenAI
+from tradingagents.dataflows.http_pool import get_openai_client
 import os
 
 class FinancialSituationMemory:
@@ -13,7 +13,7 @@ class FinancialSituationMemory:
             elif config["llm_provider"] == "google":
                 api_key = os.getenv("GOOGLE_API_KEY")
             self.embedding = config["embedding_model"]
-        self.client = OpenAI(base_url=config["backend_url"], api_key=api_key)
+        self.client = get_openai_client(config["backend_url"], api_key)
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
         self.situation_collection = self.chroma_client.create_collection(name=name)
 
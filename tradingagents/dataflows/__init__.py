@@ -1,8 +1,29 @@
 from .finnhub_utils import get_data_in_range
+from .finnhub_store import FinnhubStore, convert_finnhub_directory
+from .finnhub_cache import FinnhubDataCache, get_finnhub_cache
 from .googlenews_utils import getNewsData
+from .result_cache import ResultCache, get_result_cache
+from .http_pool import (
+    connection_stats,
+    get_http_session,
+    get_openai_client,
+    http_get,
+)
 from .yfin_utils import YFinanceUtils
 from .reddit_utils import fetch_top_from_category
+from .reddit_index import RedditDayIndex, get_reddit_day_index
 from .stockstats_utils import StockstatsUtils
+from .price_cache import (
+    PriceFrameCache,
+    format_price_frame,
+    get_price_cache,
+    slice_price_frame,
+)
+from .price_store import PriceStore
+from .indicator_store import IndicatorStore
+from .simfin_store import SimFinStore
+from .trading_calendar import TradingCalendar, get_trading_calendar
+from .batch_loader import load_price_batch
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -17,8 +38,11 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_simfin_statements_as_of,
+    get_fundamentals_snapshot,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_window_batch,
     get_stockstats_indicator,
     # Market data functions
     get_YFin_data_window,
@@ -37,8 +61,11 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_statements_as_of",
+    "get_fundamentals_snapshot",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_window_batch",
     "get_stockstats_indicator",
     # Market data functions
     "get_YFin_data_window",
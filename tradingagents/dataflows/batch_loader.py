@@ -0,0 +1,166 @@
+import time
+from collections import defaultdict
+from typing import Annotated, Callable, Dict, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .price_store import PriceStore
+
+BatchDownloader = Callable[[List[str], str, str], Dict[str, pd.DataFrame]]
+
+
+def yfinance_batch_downloader(
+    symbols: Annotated[List[str], "ticker symbols to download"],
+    start_date: Annotated[str, "start date, YYYY-mm-dd"],
+    end_date: Annotated[str, "exclusive end date, YYYY-mm-dd"],
+) -> Dict[str, pd.DataFrame]:
+    """Download adjusted daily bars for many symbols in one grouped Yahoo Finance request."""
+    data = yf.download(
+        symbols,
+        start=start_date,
+        end=end_date,
+        group_by="ticker",
+        progress=False,
+        auto_adjust=True,
+        threads=True,
+    )
+    if data.empty:
+        return {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data}
+
+    downloaded = data.columns.get_level_values(0)
+    return {
+        symbol: data[symbol].dropna(how="all")
+        for symbol in symbols
+        if symbol in downloaded
+    }
+
+
+def per_symbol_batch(
+    downloader: Annotated[
+        Callable[[str, str, str], pd.DataFrame],
+        "single-symbol downloader such as LocalCSVDownloader",
+    ],
+) -> BatchDownloader:
+    """Adapt a single-symbol downloader to the batch downloader interface."""
+
+    def batch_downloader(symbols, start_date, end_date):
+        return {symbol: downloader(symbol, start_date, end_date) for symbol in symbols}
+
+    return batch_downloader
+
+
+def load_price_batch(
+    symbols: Annotated[List[str], "ticker symbols of the watchlist"],
+    end_date: Annotated[
+        Optional[str], "exclusive end date, YYYY-mm-dd, defaults to today"
+    ] = None,
+    downloader: Annotated[
+        Optional[BatchDownloader],
+        "callable (symbols, start_date, end_date) returning {symbol: bars}, defaults to yfinance",
+    ] = None,
+    store: Annotated[Optional[PriceStore], "store to write into"] = None,
+    batch_size: Annotated[
+        Optional[int], "symbols per grouped request, defaults to config price_batch_size"
+    ] = None,
+) -> pd.DataFrame:
+    """
+    Warm the price store for a whole watchlist with grouped downloads.
+    Symbols that need the same start date (the same last stored bar, or a full
+    history) are fetched together in requests of up to batch_size symbols, and
+    every result is merged into the PriceStore that the stockstats and YFin
+    tools read from. Symbols whose stored history was re-adjusted are
+    re-downloaded in full in a second grouped pass.
+    Returns one row per symbol with the bars added, the wall time of the
+    grouped request it was part of, the time spent writing it, and a status.
+    """
+    config = get_config()
+    end_date = end_date or pd.Timestamp.today().strftime("%Y-%m-%d")
+    downloader = downloader or yfinance_batch_downloader
+    store = store or PriceStore()
+    batch_size = batch_size or config["price_batch_size"]
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+    report = {}
+    groups = defaultdict(list)
+    for symbol in symbols:
+        if store.is_refreshed(symbol, end_date):
+            report[symbol] = _report_row(symbol, 0, 0.0, 0.0, "fresh")
+            continue
+        groups[store.refresh_start(symbol, end_date)].append(symbol)
+
+    readjusted = []
+    for (start_date, incremental), group in groups.items():
+        for i in range(0, len(group), batch_size):
+            chunk = group[i : i + batch_size]
+            readjusted += _download_chunk(
+                chunk, start_date, incremental, end_date, downloader, store, report
+            )
+
+    if readjusted:
+        start_date, _ = store.refresh_start(readjusted[0], end_date, "full")
+        for i in range(0, len(readjusted), batch_size):
+            chunk = readjusted[i : i + batch_size]
+            _download_chunk(chunk, start_date, False, end_date, downloader, store, report)
+
+    return pd.DataFrame([report[symbol] for symbol in symbols])
+
+
+def _download_chunk(
+    chunk: List[str],
+    start_date: str,
+    incremental: bool,
+    end_date: str,
+    downloader: BatchDownloader,
+    store: PriceStore,
+    report: Dict[str, dict],
+) -> List[str]:
+    """Download one grouped request, merge it into the store and return re-adjusted symbols."""
+    started = time.perf_counter()
+    try:
+        downloaded = downloader(chunk, start_date, end_date)
+    except Exception as e:
+        elapsed = time.perf_counter() - started
+        for symbol in chunk:
+            report[symbol] = _report_row(symbol, 0, elapsed, 0.0, f"error: {e}")
+        return []
+    elapsed = time.perf_counter() - started
+
+    readjusted = []
+    for symbol in chunk:
+        bars = downloaded.get(symbol)
+        write_started = time.perf_counter()
+        try:
+            if bars is None or bars.empty:
+                # nothing is written, so the symbol is retried on the next load
+                status, added = "empty", 0
+            elif incremental:
+                added = store.merge_tail(symbol, bars, end_date)
+                status = "ok"
+                if added is None:
+                    readjusted.append(symbol)
+                    continue
+            else:
+                added = store.merge_full(symbol, bars, end_date)
+                status = "ok"
+        except Exception as e:
+            status, added = f"error: {e}", 0
+        report[symbol] = _report_row(
+            symbol, added, elapsed, time.perf_counter() - write_started, status
+        )
+    return readjusted
+
+
+def _report_row(
+    symbol: str, bars_added: int, download_seconds: float, store_seconds: float, status: str
+) -> dict:
+    return {
+        "symbol": symbol,
+        "bars_added": bars_added,
+        "download_seconds": round(download_seconds, 4),
+        "store_seconds": round(store_seconds, 4),
+        "status": status,
+    }
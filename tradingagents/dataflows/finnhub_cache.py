@@ -0,0 +1,93 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict, List, Optional
+
+from .config import get_config
+
+
+class FinnhubDataCache:
+    """
+    Bounded, process-wide LRU cache of parsed Finnhub data.
+    Entries are keyed by (ticker, data_type, period, ...) and remember the
+    mtime and size of the JSON file they came from, so a rewritten file is
+    read again. The least recently used entries are evicted once more than
+    max_entries are held.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _file_version(path: str) -> Optional[tuple]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(
+        self,
+        key: Annotated[tuple, "(ticker, data_type, period, ...) identifying the entry"],
+        path: Annotated[str, "JSON file the data is derived from"],
+        loader: Annotated[
+            Callable[[], Dict[str, List[dict]]], "reads the data on a miss"
+        ],
+    ) -> Dict[str, List[dict]]:
+        """Return the cached data for key, calling loader on a miss or after the file changed."""
+        version = self._file_version(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+
+        data = loader()
+        with self._lock:
+            self._entries[key] = (version, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return dict(data)
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the number of cached entries."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+
+_finnhub_cache: Optional[FinnhubDataCache] = None
+_finnhub_cache_lock = threading.Lock()
+
+
+def get_finnhub_cache() -> FinnhubDataCache:
+    """Return the shared Finnhub data cache, creating it from the config on first use."""
+    global _finnhub_cache
+    with _finnhub_cache_lock:
+        if _finnhub_cache is None:
+            _finnhub_cache = FinnhubDataCache(
+                max_entries=get_config()["finnhub_cache_max_entries"]
+            )
+        return _finnhub_cache
@@ -0,0 +1,195 @@
+import glob
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Annotated, Dict, List, Optional
+
+from .config import get_config
+from .json_codec import load_file, loads
+
+_write_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS finnhub_data (
+    ticker TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (ticker, data_type, period, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS finnhub_sources (
+    ticker TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    period TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (ticker, data_type, period)
+) WITHOUT ROWID;
+"""
+
+
+def finnhub_json_path(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    data_type: Annotated[str, "finnhub data type, e.g. news_data or insider_trans"],
+    data_dir: Annotated[str, "directory where the data is saved"],
+    period: Annotated[Optional[str], "annual or quarterly, if any"] = None,
+) -> str:
+    """Return the path of a `{ticker}[_{period}]_data_formatted.json` file."""
+    if period:
+        filename = f"{ticker}_{period}_data_formatted.json"
+    else:
+        filename = f"{ticker}_data_formatted.json"
+    return os.path.join(data_dir, "finnhub_data", data_type, filename)
+
+
+class FinnhubStore:
+    """
+    Date-indexed SQLite store of the Finnhub data saved on disk.
+    Every non-empty day of a `{ticker}_data_formatted.json` file becomes one
+    row keyed by (ticker, data_type, period, date), so a range query is a
+    seek on the primary key that reads only the requested days instead of
+    parsing the whole file. The mtime and size of each converted JSON file
+    are recorded, and a file that changed on disk is converted again.
+    """
+
+    def __init__(
+        self,
+        path: Annotated[
+            Optional[str],
+            "SQLite database file, defaults to data_cache_dir/finnhub_store.sqlite",
+        ] = None,
+    ):
+        if path is None:
+            path = os.path.join(get_config()["data_cache_dir"], "finnhub_store.sqlite")
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _source_stat(self, ticker: str, data_type: str, period: str):
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT mtime_ns, size FROM finnhub_sources"
+                " WHERE ticker = ? AND data_type = ? AND period = ?",
+                (ticker, data_type, period),
+            ).fetchone()
+
+    def is_converted(
+        self,
+        ticker: Annotated[str, "ticker symbol of the company"],
+        data_type: Annotated[str, "finnhub data type"],
+        data_dir: Annotated[str, "directory where the data is saved"],
+        period: Annotated[Optional[str], "annual or quarterly, if any"] = None,
+    ) -> bool:
+        """
+        Check whether the store holds the current version of a JSON file.
+        When the JSON file was removed after conversion, the stored rows are
+        treated as current.
+        """
+        stored = self._source_stat(ticker, data_type, period or "")
+        if stored is None:
+            return False
+        json_path = finnhub_json_path(ticker, data_type, data_dir, period)
+        if not os.path.exists(json_path):
+            return True
+        stat = os.stat(json_path)
+        return tuple(stored) == (stat.st_mtime_ns, stat.st_size)
+
+    def convert(
+        self,
+        ticker: Annotated[str, "ticker symbol of the company"],
+        data_type: Annotated[str, "finnhub data type"],
+        data_dir: Annotated[str, "directory where the data is saved"],
+        period: Annotated[Optional[str], "annual or quarterly, if any"] = None,
+    ) -> int:
+        """Load one JSON file into the store, replacing its old rows, and return the number of days stored."""
+        json_path = finnhub_json_path(ticker, data_type, data_dir, period)
+        stat = os.stat(json_path)
+        data = load_file(json_path)
+
+        period = period or ""
+        rows = [
+            (ticker, data_type, period, date, json.dumps(value))
+            for date, value in data.items()
+            if len(value) > 0
+        ]
+        with _write_lock, self._connect() as conn:
+            conn.execute(
+                "DELETE FROM finnhub_data WHERE ticker = ? AND data_type = ? AND period = ?",
+                (ticker, data_type, period),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO finnhub_data VALUES (?, ?, ?, ?, ?)", rows
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO finnhub_sources VALUES (?, ?, ?, ?, ?)",
+                (ticker, data_type, period, stat.st_mtime_ns, stat.st_size),
+            )
+        return len(rows)
+
+    def get_range(
+        self,
+        ticker: Annotated[str, "ticker symbol of the company"],
+        data_type: Annotated[str, "finnhub data type"],
+        start_date: Annotated[str, "start date, YYYY-mm-dd (inclusive)"],
+        end_date: Annotated[str, "end date, YYYY-mm-dd (inclusive)"],
+        period: Annotated[Optional[str], "annual or quarterly, if any"] = None,
+    ) -> Dict[str, List[dict]]:
+        """Return the non-empty days between start_date and end_date, in date order."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT date, payload FROM finnhub_data"
+                " WHERE ticker = ? AND data_type = ? AND period = ?"
+                " AND date BETWEEN ? AND ? ORDER BY date",
+                (ticker, data_type, period or "", start_date, end_date),
+            ).fetchall()
+        return {date: loads(payload) for date, payload in rows}
+
+
+def convert_finnhub_directory(
+    data_dir: Annotated[str, "directory where the data is saved"],
+    store: Annotated[Optional[FinnhubStore], "store to write into"] = None,
+) -> Dict[str, int]:
+    """
+    One-time conversion of every `finnhub_data/*/*_data_formatted.json` file
+    under data_dir into the store. Returns the number of days stored per file.
+    """
+    store = store or get_finnhub_store()
+    converted = {}
+    pattern = os.path.join(data_dir, "finnhub_data", "*", "*_data_formatted.json")
+    for json_path in sorted(glob.glob(pattern)):
+        data_type = os.path.basename(os.path.dirname(json_path))
+        name = os.path.basename(json_path)[: -len("_data_formatted.json")]
+        ticker, period = name, None
+        for suffix in ("annual", "quarterly"):
+            if name.endswith(f"_{suffix}"):
+                ticker, period = name[: -len(suffix) - 1], suffix
+        converted[json_path] = store.convert(ticker, data_type, data_dir, period)
+    return converted
+
+
+_stores: Dict[str, FinnhubStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_finnhub_store() -> FinnhubStore:
+    """Return the shared store for the configured data_cache_dir."""
+    path = os.path.join(get_config()["data_cache_dir"], "finnhub_store.sqlite")
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = FinnhubStore(path)
+        return _stores[path]
@@ -1,5 +1,7 @@
-import json
-import os
+from .config import get_config
+from .finnhub_cache import get_finnhub_cache
+from .finnhub_store import finnhub_json_path, get_finnhub_store
+from .json_codec import load_file
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -13,20 +15,25 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
+    data_path = finnhub_json_path(ticker, data_type, data_dir, period)
+    cache = get_finnhub_cache()
+
+    if get_config()["finnhub_backend"] == "sqlite":
+
+        def load_range():
+            # convert the JSON file once, then answer range queries from the date index
+            store = get_finnhub_store()
+            if not store.is_converted(ticker, data_type, data_dir, period):
+                store.convert(ticker, data_type, data_dir, period)
+            return store.get_range(ticker, data_type, start_date, end_date, period)
+
+        return cache.get(
+            (ticker, data_type, period, start_date, end_date), data_path, load_range
         )
 
-    data = open(data_path, "r")
-    data = json.load(data)
+    data = cache.get(
+        (ticker, data_type, period), data_path, lambda: load_file(data_path)
+    )
 
     # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
     filtered_data = {}
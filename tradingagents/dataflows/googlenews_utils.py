@@ -1,7 +1,8 @@
 import json
-import requests
 from bs4 import BeautifulSoup
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+import threading
 import time
 import random
 from tenacity import (
@@ -12,6 +13,16 @@ from tenacity import (
     retry_if_result,
 )
 
+try:
+    from parsel import Selector
+except ImportError:
+    Selector = None
+
+from .config import get_config
+from .http_pool import http_get
+from .rate_limiter import TokenBucket
+from .result_cache import get_result_cache
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -27,23 +38,174 @@ def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
     # Random delay before each request to avoid detection
     time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    response = http_get(url, headers=headers)
     return response
 
 
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Return the token bucket shared by every Google News query in the process."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            config = get_config()
+            _rate_limiter = TokenBucket(
+                config["google_news_rate"], config["google_news_burst"]
+            )
+        return _rate_limiter
+
+
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+)
+def fetch_page(url, headers):
+    """Fetch one page through the pooled session, paced by the shared rate limiter"""
+    get_rate_limiter().acquire()
+    return http_get(url, headers=headers)
+
+
+def _page_url(query, start_date, end_date, page):
+    return (
+        f"{get_config()['google_news_url']}?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={page * 10}"
+    )
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_RESULT_XPATH = f"//div[{_has_class('SoaBEf')}]"
+_LINK_XPATH = "(.//a)[1]"
+# same elements as the CSS selectors of the BeautifulSoup path
+_FIELD_XPATHS = {
+    "title": f"(.//div[{_has_class('MBeuO')}])[1]",
+    "snippet": f"(.//*[{_has_class('GI74Re')}])[1]",
+    "date": f"(.//*[{_has_class('LfVVr')}])[1]",
+    "source": f"(.//*[{_has_class('NUnG9d')}]//span)[1]",
+}
+_NEXT_XPATH = "//a[@id='pnnext']"
+
+
+def _active_parser(config):
+    """Name of the parser google_news_parser selects; bs4 when parsel is not installed."""
+    if config["google_news_parser"] == "parsel" and Selector is not None:
+        return "parsel"
+    return "bs4"
+
+
+def _parse_page(content):
+    """Return the results of one page and whether it links to a next page."""
+    if _active_parser(get_config()) == "parsel":
+        return _parse_page_parsel(content)
+    return _parse_page_bs4(content)
+
+
+def _parse_page_parsel(content):
+    """
+    Extract the results with parsel's lxml-backed XPath queries, producing
+    the same dicts as the BeautifulSoup path at a fraction of its cost. A
+    result with a missing field is skipped with the same message the
+    BeautifulSoup path prints for it.
+    """
+    selector = Selector(body=content, type="html")
+    results = []
+    for el in selector.xpath(_RESULT_XPATH):
+        link = el.xpath(_LINK_XPATH)
+        if not link:
+            error = "'NoneType' object is not subscriptable"
+        elif "href" not in link.attrib:
+            error = "'href'"
+        else:
+            error = None
+            result = {"link": link.attrib["href"]}
+            for name, xpath in _FIELD_XPATHS.items():
+                found = el.xpath(xpath)
+                if not found:
+                    error = "'NoneType' object has no attribute 'get_text'"
+                    break
+                result[name] = found.xpath("string()").get()
+
+        if error is not None:
+            print(f"Error processing result: {error}")
+            # If one of the fields is not found, skip this result
+            continue
+        results.append(result)
+
+    return results, bool(selector.xpath(_NEXT_XPATH))
+
+
+def _parse_page_bs4(content):
+    soup = BeautifulSoup(content, "html.parser")
+    results = []
+    for el in soup.select("div.SoaBEf"):
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    return results, soup.find("a", id="pnnext") is not None
+
+
+def _news_cache_key(query, start, end, config):
+    """
+    Key of a search: the search URL and the parser that scraped it, the
+    query lower-cased with `+` and runs of whitespace folded, and the window
+    in yyyy-mm-dd.
+    """
+    query = " ".join(query.replace("+", " ").lower().split())
+    return (
+        f"{config['google_news_url']}|{_active_parser(config)}"
+        f"|{query}|{start:%Y-%m-%d}|{end:%Y-%m-%d}"
+    )
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+
+    With google_news_cache enabled, complete non-empty results are stored
+    in the result cache: permanently when the window ends before today,
+    for google_news_cache_ttl seconds when it includes today.
     """
-    if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        start_date = start_date.strftime("%m/%d/%Y")
-    if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        end_date = end_date.strftime("%m/%d/%Y")
+    start, end = (
+        datetime.strptime(value, "%Y-%m-%d" if "-" in value else "%m/%d/%Y")
+        for value in (start_date, end_date)
+    )
+    start_date = start.strftime("%m/%d/%Y")
+    end_date = end.strftime("%m/%d/%Y")
+
+    config = get_config()
+    cache = get_result_cache() if config["google_news_cache"] else None
+    if cache is not None:
+        key = _news_cache_key(query, start, end, config)
+        cached = cache.get("google_news", key)
+        if cached is not None:
+            return cached
 
     headers = {
         "User-Agent": (
@@ -53,56 +215,104 @@ def getNewsData(query, start_date, end_date):
         )
     }
 
+    if config["google_news_mode"] == "concurrent":
+        news_results, complete = _get_news_concurrent(query, start_date, end_date, headers)
+    else:
+        news_results, complete = _get_news_serial(query, start_date, end_date, headers)
+
+    # an empty or interrupted scrape may be a block page or a network error
+    if cache is not None and complete and news_results:
+        historical = end.date() < date.today()
+        ttl = None if historical else config["google_news_cache_ttl"]
+        cache.set("google_news", key, news_results, ttl=ttl)
+
+    return news_results
+
+
+def _get_news_serial(query, start_date, end_date, headers):
+    """Fetch the result pages of a query one by one; returns (results, whether every page was fetched)."""
     news_results = []
     page = 0
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+        url = _page_url(query, start_date, end_date, page)
 
         try:
             response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
+            if not response.ok:
+                return news_results, False
+            results_on_page, has_next = _parse_page(response.content)
 
             if not results_on_page:
                 break  # No more results found
 
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
+            news_results.extend(results_on_page)
 
             # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            if not has_next:
                 break
 
             page += 1
 
         except Exception as e:
             print(f"Failed after multiple retries: {e}")
-            break
+            return news_results, False
 
-    return news_results
+    return news_results, True
+
+
+def _get_news_concurrent(query, start_date, end_date, headers):
+    """
+    Fetch the result pages of a query with bounded concurrency. The first
+    page is fetched alone; while the last page read links to a next page,
+    the following `google_news_prefetch_pages` pages (at most
+    `google_news_concurrency`) are fetched together and consumed in page
+    order, stopping at the first page that is empty or has no next link.
+    With the default of 1 no page is requested before the previous one
+    has shown its next link; larger values trade extra requests past the
+    last page for latency. Pacing comes only from the shared rate limiter.
+    Returns (results, whether every page was fetched).
+    """
+    config = get_config()
+    workers = max(1, int(config["google_news_concurrency"]))
+    prefetch = max(1, min(int(config["google_news_prefetch_pages"]), workers))
+
+    news_results = []
+    complete = True
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        page, batch = 0, 1
+        while True:
+            futures = [
+                executor.submit(
+                    fetch_page, _page_url(query, start_date, end_date, p), headers
+                )
+                for p in range(page, page + batch)
+            ]
+
+            done = False
+            for future in futures:
+                try:
+                    response = future.result()
+                    if not response.ok:
+                        complete, done = False, True
+                        break
+                    results_on_page, has_next = _parse_page(response.content)
+                except Exception as e:
+                    print(f"Failed after multiple retries: {e}")
+                    complete, done = False, True
+                    break
+
+                if not results_on_page:
+                    done = True
+                    break
+                news_results.extend(results_on_page)
+                if not has_next:
+                    done = True
+                    break
+
+            if done:
+                for future in futures:
+                    future.cancel()
+                break
+            page, batch = page + batch, prefetch
+
+    return news_results, complete
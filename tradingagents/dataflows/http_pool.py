@@ -0,0 +1,109 @@
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import requests
+from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import get_config
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_openai_clients: Dict[Tuple[str, Optional[str]], OpenAI] = {}
+_openai_uses = 0
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide `requests.Session` used by every dataflow that
+    fetches web pages. Connections are kept alive in a pool of
+    `http_pool_connections` hosts with up to `http_pool_maxsize`
+    connections each, so repeated requests to a host skip the TCP/TLS
+    handshake. Connection errors and 5xx responses of GET requests are
+    retried `http_max_retries` times with exponential backoff; 429 is left
+    to the caller, which knows how to pace itself.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            config = get_config()
+            retries = Retry(
+                total=config["http_max_retries"],
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=("GET", "HEAD"),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=config["http_pool_connections"],
+                pool_maxsize=config["http_pool_maxsize"],
+                max_retries=retries,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def http_get(
+    url: Annotated[str, "URL to fetch"],
+    **kwargs,
+) -> requests.Response:
+    """GET through the shared session, with `http_timeout` unless a timeout is given."""
+    kwargs.setdefault("timeout", get_config()["http_timeout"])
+    return get_http_session().get(url, **kwargs)
+
+
+def get_openai_client(
+    base_url: Annotated[Optional[str], "API base URL, defaults to backend_url"] = None,
+    api_key: Annotated[Optional[str], "API key, defaults to the OPENAI_API_KEY environment variable"] = None,
+) -> OpenAI:
+    """
+    Return the shared OpenAI client of an endpoint. One client is built per
+    (base_url, api_key) and reused, so its connection pool stays warm across
+    tool calls; `openai_timeout` and `openai_max_retries` configure it.
+    """
+    global _openai_uses
+    config = get_config()
+    base_url = base_url or config["backend_url"]
+    with _lock:
+        client = _openai_clients.get((base_url, api_key))
+        if client is None:
+            client = OpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=config["openai_timeout"],
+                max_retries=config["openai_max_retries"],
+            )
+            _openai_clients[(base_url, api_key)] = client
+        _openai_uses += 1
+    return client
+
+
+def connection_stats() -> Dict[str, int]:
+    """
+    Connection reuse of the shared clients. `http_requests` and
+    `http_connections` count the requests sent and connections opened by
+    the pools currently held by the session; `http_reused` is how many
+    requests went over an already open connection.
+    """
+    requests_sent = connections = 0
+    with _lock:
+        if _session is not None:
+            # http:// and https:// share one adapter
+            adapters = {id(adapter): adapter for adapter in _session.adapters.values()}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools[key]
+                    requests_sent += pool.num_requests
+                    connections += pool.num_connections
+        return {
+            "http_requests": requests_sent,
+            "http_connections": connections,
+            "http_reused": max(0, requests_sent - connections),
+            "openai_clients": len(_openai_clients),
+            "openai_client_uses": _openai_uses,
+        }
@@ -0,0 +1,208 @@
+from typing import Annotated, Dict, List
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+BOLL_STD_TIMES = 2
+
+SUPPORTED_INDICATORS = frozenset(
+    [
+        "close_50_sma",
+        "close_200_sma",
+        "close_10_ema",
+        "macd",
+        "macds",
+        "macdh",
+        "rsi",
+        "boll",
+        "boll_ub",
+        "boll_lb",
+        "atr",
+        "vwma",
+        "mfi",
+    ]
+)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum over the last `window` values, using partial windows at the start."""
+    cumsum = np.cumsum(values)
+    out = cumsum.copy()
+    out[window:] = cumsum[window:] - cumsum[:-window]
+    return out
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    counts = np.minimum(np.arange(1, len(values) + 1), window)
+    return _rolling_sum(values, window) / counts
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation over a rolling window, NaN for single-value windows."""
+    out = np.full(len(values), np.nan)
+    head = min(window - 1, len(values))
+    for i in range(1, head):
+        out[i] = values[: i + 1].std(ddof=1)
+    if len(values) >= window:
+        out[window - 1 :] = sliding_window_view(values, window).std(axis=1, ddof=1)
+    return out
+
+
+def _ewm_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Adjusted exponentially weighted mean, equal to
+    `pd.Series(values).ewm(alpha=alpha, adjust=True).mean()` for data
+    without NaNs. The recurrence is evaluated in blocks: inside a block the
+    weights are applied with one cumulative sum, and the running numerator
+    and denominator are carried over to the next block.
+    """
+    n = len(values)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        return values.astype(float)
+
+    # keep decay ** -block well inside the float64 range
+    block = int(max(1, min(1024, 300 / -np.log(decay))))
+    num = 0.0
+    den = 0.0
+    for start in range(0, n, block):
+        chunk = values[start : start + block]
+        k = np.arange(len(chunk))
+        growth = decay ** -k
+        shrink = decay**k
+        out_num = shrink * (decay * num + np.cumsum(chunk * growth))
+        out_den = shrink * (decay * den + np.cumsum(growth))
+        out[start : start + len(chunk)] = out_num / out_den
+        num = out_num[-1]
+        den = out_den[-1]
+    return out
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    return _ewm_mean(values, 2.0 / (span + 1.0))
+
+
+def _smma(values: np.ndarray, window: int) -> np.ndarray:
+    return _ewm_mean(values, 1.0 / window)
+
+
+def _diff(values: np.ndarray) -> np.ndarray:
+    diff = np.zeros_like(values)
+    diff[1:] = np.diff(values)
+    return diff
+
+
+def _typical_price(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return (close + high + low) / 3.0
+
+
+def sma(close: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_mean(close, window)
+
+
+def macd(close: np.ndarray, short: int = 12, long: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    macd_line = _ema(close, short) - _ema(close, long)
+    signal_line = _ema(macd_line, signal)
+    return {"macd": macd_line, "macds": signal_line, "macdh": macd_line - signal_line}
+
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    diff = _diff(close)
+    up = _smma(np.where(diff > 0, diff, 0.0), window)
+    down = _smma(np.where(diff < 0, -diff, 0.0), window)
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up / total), 50.0)
+    out[0] = 50.0
+    return out
+
+
+def boll(close: np.ndarray, window: int = 20) -> Dict[str, np.ndarray]:
+    middle = _rolling_mean(close, window)
+    width = BOLL_STD_TIMES * _rolling_std(close, window)
+    return {"boll": middle, "boll_ub": middle + width, "boll_lb": middle - width}
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = 14) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    prev_close[:1] = close[:1]
+    prev_close[1:] = close[:-1]
+    true_range = np.maximum(
+        high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+    return _smma(np.nan_to_num(true_range), window)
+
+
+def vwma(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, window: int = 14
+) -> np.ndarray:
+    rolling_tpv = _rolling_sum(volume * _typical_price(high, low, close), window)
+    rolling_vol = _rolling_sum(volume, window)
+    return np.divide(
+        rolling_tpv, rolling_vol, out=np.zeros_like(rolling_tpv), where=rolling_vol != 0
+    )
+
+
+def mfi(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, window: int = 14
+) -> np.ndarray:
+    tp = _typical_price(high, low, close)
+    raw_money_flow = tp * volume
+    tp_diff = _diff(tp)
+    pos_sum = _rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), window)
+    neg_sum = _rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), window)
+    total = pos_sum + neg_sum
+    out = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    out[:window] = 0.5
+    return out
+
+
+def compute_indicators(
+    data: Annotated[pd.DataFrame, "price data with a datetime Date column"],
+    indicators: Annotated[List[str], "indicator names from BEST_IND_PARAMS"],
+) -> pd.DataFrame:
+    """
+    Compute the requested indicators with NumPy and return them as a
+    date-indexed frame. Each indicator follows the stockstats definition of
+    the same name (partial rolling windows at the start, adjusted EWMs, SMMA
+    for RSI and ATR), so the values match `stockstats.wrap(data)[name]`
+    without copying the frame into a StockDataFrame.
+    """
+    columns = {col.lower(): col for col in data.columns}
+    high = data[columns["high"]].to_numpy(dtype=float)
+    low = data[columns["low"]].to_numpy(dtype=float)
+    close = data[columns["close"]].to_numpy(dtype=float)
+    volume = data[columns["volume"]].to_numpy(dtype=float)
+
+    builders = {
+        "close_50_sma": lambda: {"close_50_sma": sma(close, 50)},
+        "close_200_sma": lambda: {"close_200_sma": sma(close, 200)},
+        "close_10_ema": lambda: {"close_10_ema": _ema(close, 10)},
+        "macd": lambda: macd(close),
+        "macds": lambda: macd(close),
+        "macdh": lambda: macd(close),
+        "rsi": lambda: {"rsi": rsi(close)},
+        "boll": lambda: boll(close),
+        "boll_ub": lambda: boll(close),
+        "boll_lb": lambda: boll(close),
+        "atr": lambda: {"atr": atr(high, low, close)},
+        "vwma": lambda: {"vwma": vwma(high, low, close, volume)},
+        "mfi": lambda: {"mfi": mfi(high, low, close, volume)},
+    }
+
+    results: Dict[str, np.ndarray] = {}
+    for indicator in indicators:
+        if indicator not in builders:
+            raise ValueError(f"Indicator {indicator} is not supported by the numpy engine.")
+        if indicator not in results:
+            results.update(builders[indicator]())
+
+    return pd.DataFrame(
+        {indicator: results[indicator] for indicator in indicators},
+        index=pd.DatetimeIndex(data["Date"], name="Date"),
+    )
+
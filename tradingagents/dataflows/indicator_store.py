@@ -0,0 +1,140 @@
+import hashlib
+import os
+import threading
+from typing import Annotated, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from .config import get_config
+from .price_cache import load_frame
+
+_write_lock = threading.Lock()
+
+# (price file, indicators) -> (mtime and size of the file, fingerprint of its data)
+_fingerprints: Dict[tuple, Tuple[tuple, str]] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def file_signature(path: Annotated[str, "path of a price file"]) -> Optional[tuple]:
+    """Return the (mtime, size) of a file, or None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class IndicatorStore:
+    """
+    Persisted matrix of precomputed indicators per symbol and price source.
+    Each matrix is an uncompressed Feather file under
+    `{data_cache_dir}/indicator_store`, indexed by trading date with one
+    column per indicator. It carries a fingerprint of the price data it was
+    computed from and is rebuilt whenever that data changes, e.g. after a
+    price refresh.
+    """
+
+    def __init__(
+        self,
+        root: Annotated[
+            Optional[str],
+            "directory of the store, defaults to data_cache_dir/indicator_store",
+        ] = None,
+    ):
+        if root is None:
+            root = os.path.join(get_config()["data_cache_dir"], "indicator_store")
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        source: Annotated[str, "label of the price data the matrix is built from"],
+    ) -> str:
+        return os.path.join(self.root, f"{symbol.upper()}-{source}-indicators.feather")
+
+    @staticmethod
+    def fingerprint(
+        data: Annotated[pd.DataFrame, "price data"],
+        indicators: Annotated[Sequence[str], "indicators the matrix holds"],
+    ) -> str:
+        """Hash the price data, in order, and the indicator names so a stale matrix can be detected."""
+        digest = hashlib.sha256()
+        digest.update("\0".join(sorted(indicators)).encode())
+        digest.update(b"\1" + "\0".join(map(str, data.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _cached_fingerprint(
+        self,
+        data: pd.DataFrame,
+        indicators: List[str],
+        price_path: Optional[str],
+        price_signature: Optional[tuple],
+    ) -> str:
+        """Return the fingerprint of data, hashing it only when its price file changed."""
+        if price_path is None or price_signature is None:
+            return self.fingerprint(data, indicators)
+        key = (os.path.abspath(price_path), tuple(sorted(indicators)))
+        with _fingerprints_lock:
+            cached = _fingerprints.get(key)
+        if cached is not None and cached[0] == price_signature:
+            return cached[1]
+        fingerprint = self.fingerprint(data, indicators)
+        with _fingerprints_lock:
+            _fingerprints[key] = (price_signature, fingerprint)
+        return fingerprint
+
+    @staticmethod
+    def _read_file(path: str) -> pd.DataFrame:
+        table = feather.read_table(path, memory_map=True)
+        return table.to_pandas().set_index("Date")
+
+    def _stored_fingerprint(self, path: str) -> Optional[str]:
+        if not os.path.exists(path):
+            return None
+        with pa.memory_map(path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+        value = metadata.get(b"fingerprint")
+        return value.decode() if value is not None else None
+
+    def get_matrix(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        source: Annotated[str, "label of the price data the matrix is built from"],
+        data: Annotated[pd.DataFrame, "price data with a Date column"],
+        indicators: Annotated[List[str], "indicators the matrix must contain"],
+        compute: Annotated[
+            Callable[[pd.DataFrame, List[str]], pd.DataFrame],
+            "builds a date-indexed frame with one column per indicator",
+        ],
+        price_path: Annotated[
+            Optional[str], "file the price data was read from, None to hash it on every call"
+        ] = None,
+        price_signature: Annotated[
+            Optional[tuple], "file_signature of price_path taken before the data was read"
+        ] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the date-indexed indicator matrix for a symbol, building and
+        persisting it only when the price data or the indicators changed
+        since the last build. Given the price file and its signature, the
+        data is hashed once per version of the file instead of on every call.
+        """
+        path = self.path(symbol, source)
+        fingerprint = self._cached_fingerprint(data, indicators, price_path, price_signature)
+
+        if self._stored_fingerprint(path) != fingerprint:
+            matrix = compute(data, indicators).reset_index()
+            table = pa.Table.from_pandas(matrix, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b"fingerprint": fingerprint.encode()}
+            )
+            with _write_lock:
+                tmp_path = path + ".tmp"
+                feather.write_feather(table, tmp_path, compression="uncompressed")
+                os.replace(tmp_path, path)
+
+        return load_frame(symbol.upper(), f"indicators-{source}", path, self._read_file)
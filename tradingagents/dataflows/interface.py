@@ -1,18 +1,27 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List, Optional
+from .reddit_utils import fetch_top_from_category_range
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
 from .finnhub_utils import get_data_in_range
+from .price_cache import (
+    format_price_frame,
+    load_price_rows,
+    price_rows_frame,
+    slice_price_frame,
+)
+from .http_pool import get_openai_client
+from .result_cache import get_result_cache
+from .simfin_store import SIMFIN_STATEMENTS, load_simfin_store
 from dateutil.relativedelta import relativedelta
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+import hashlib
 import json
 import os
 import pandas as pd
-from tqdm import tqdm
+import threading
 import yfinance as yf
-from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
 
 
@@ -58,6 +67,37 @@ def get_finnhub_news(
     return f"## {ticker} 新聞, from {before} to {curr_date}:\n" + str(combined_result)
 
 
+def _freeze(value):
+    """Hashable stand-in for a JSON value that compares like the value itself."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _entry_key(entry: dict):
+    """Hashable key that is equal for two entries exactly when the dicts are equal."""
+    try:
+        return frozenset(entry.items())
+    except TypeError:
+        # nested lists or dicts
+        return _freeze(entry)
+
+
+def _unique_entries(data: Dict[str, List[dict]]) -> List[dict]:
+    """Flatten the per-day entries, keeping the first occurrence of each entry, in linear time."""
+    seen = set()
+    unique = []
+    for entries in data.values():
+        for entry in entries:
+            key = _entry_key(entry)
+            if key not in seen:
+                seen.add(key)
+                unique.append(entry)
+    return unique
+
+
 def get_finnhub_company_insider_sentiment(
     ticker: Annotated[str, "ticker symbol for the company"],
     curr_date: Annotated[
@@ -84,17 +124,15 @@ def get_finnhub_company_insider_sentiment(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    result = []
+    for entry in _unique_entries(data):
+        result.append(
+            f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
+        )
 
     return (
         f"## {ticker} 內部人士情緒資料 from {before} to {curr_date}:\n"
-        + result_str
+        + "".join(result)
         + "change 欄位指的是所有內部人士交易淨買賣。mspr 欄位指的是每月購買股權比例。"
     )
 
@@ -125,18 +163,15 @@ def get_finnhub_company_insider_transactions(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    result = []
+    for entry in _unique_entries(data):
+        result.append(
+            f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+        )
 
     return (
         f"## {ticker} 內部人士交易 from {before} to {curr_date}:\n"
-        + result_str
+        + "".join(result)
         + "change 欄位反映持股數量的變化——負數表示持股減少，而 share 指定涉及的總股數。transactionPrice 表示交易執行的每股價格，而 transactionDate 標記交易發生的時間。name 欄位識別進行交易的內部人士，而 transactionCode（例如 S 表示銷售）說明交易的性質。FilingDate 記錄交易正式報告的日期，而 unique id 鏈接到特定的 SEC 報告，由源頭指示。此外，symbol 將交易與特定公司聯繫起來，isDerivative 標記交易是否涉及衍生證券，而 currency 註明交易的貨幣背景。"
     )
 
@@ -149,35 +184,16 @@ def get_simfin_balance_sheet(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
+    # read only this ticker's rows from the partitioned SimFin store
+    latest_balance_sheet = load_simfin_store("balance_sheet", freq, DATA_DIR).latest(
+        "balance_sheet", freq, ticker, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -196,35 +212,16 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
+    # read only this ticker's rows from the partitioned SimFin store
+    latest_cash_flow = load_simfin_store("cash_flow", freq, DATA_DIR).latest(
+        "cash_flow", freq, ticker, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -243,35 +240,16 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
+    # read only this ticker's rows from the partitioned SimFin store
+    latest_income = load_simfin_store("income_statements", freq, DATA_DIR).latest(
+        "income_statements", freq, ticker, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -282,6 +260,69 @@ def get_simfin_income_statements(
     )
 
 
+def get_simfin_statements_as_of(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    dates: Annotated[List[str], "trade dates, yyyy-mm-dd"],
+) -> pd.DataFrame:
+    """
+    Point-in-time SimFin lookup for many trade dates at once, e.g. for a
+    backtest. Returns one row per date, indexed by the date, holding the
+    latest statement published on or before it (NaN where none was).
+    """
+    if statement not in SIMFIN_STATEMENTS:
+        raise ValueError(
+            f"Statement {statement} is not supported. Please choose from: {list(SIMFIN_STATEMENTS)}"
+        )
+    return load_simfin_store(statement, freq, DATA_DIR).as_of(
+        statement, freq, ticker, dates
+    )
+
+
+def get_fundamentals_snapshot(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    look_back_days: Annotated[int, "how many days of insider data to look back"] = 30,
+) -> str:
+    """
+    Build every offline fundamentals section for a company in one call:
+    insider sentiment, insider transactions, and the latest balance sheet,
+    cash flow and income statement. The sections are loaded concurrently and
+    share the Finnhub cache and the partitioned SimFin store, and sections
+    without data are left out.
+    """
+    sections = [
+        (get_finnhub_company_insider_sentiment, (ticker, curr_date, look_back_days)),
+        (get_finnhub_company_insider_transactions, (ticker, curr_date, look_back_days)),
+        (get_simfin_balance_sheet, (ticker, freq, curr_date)),
+        (get_simfin_cashflow, (ticker, freq, curr_date)),
+        (get_simfin_income_statements, (ticker, freq, curr_date)),
+    ]
+
+    def build(section):
+        func, args = section
+        try:
+            return func(*args)
+        except Exception as e:
+            print(f"Error getting {func.__name__} for {ticker} on {curr_date}: {e}")
+            return ""
+
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        reports = list(executor.map(build, sections))
+
+    return f"# {ticker} 基本面快照 as of {curr_date}:\n\n" + "\n\n".join(
+        report for report in reports if report
+    )
+
+
 def get_google_news(
     query: Annotated[str, "Query to search with"],
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -326,26 +367,14 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # one pass over each subreddit file for the whole look-back window
+    posts = fetch_top_from_category_range(
+        "global_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
 
     if len(posts) == 0:
         return ""
@@ -357,7 +386,7 @@ def get_reddit_global_news(
         else:
             news_str += f"### {post['title']}\n\n{post['content']}\n\n"
 
-    return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
+    return f"## Global News Reddit, from {before} to {start_date.strftime('%Y-%m-%d')}:\n{news_str}"
 
 
 def get_reddit_company_news(
@@ -380,32 +409,16 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # one pass over each subreddit file for the whole look-back window
+    posts = fetch_top_from_category_range(
+        "company_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
 
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
-
     if len(posts) == 0:
         return ""
 
@@ -416,7 +429,7 @@ def get_reddit_company_news(
         else:
             news_str += f"### {post['title']}\n\n{post['content']}\n\n"
 
-    return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
+    return f"##{ticker} News Reddit, from {before} to {start_date.strftime('%Y-%m-%d')}:\n\n{news_str}"
 
 
 def get_stock_stats_indicators_window(
@@ -429,130 +442,75 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
+    return get_stock_stats_indicators_window_batch(
+        symbol, [indicator], curr_date, look_back_days, online
+    )
 
-    if indicator not in best_ind_params:
-        raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
-        )
+
+def get_stock_stats_indicators_window_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> str:
+    """
+    Report several indicators for the same window from a single load of the
+    price data. Each indicator gets the same section that
+    get_stock_stats_indicators_window produces for it on its own.
+    """
+
+    for indicator in indicators:
+        if indicator not in BEST_IND_PARAMS:
+            raise ValueError(
+                f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+            )
+
+    # preserve the requested order while computing each indicator only once
+    indicators = list(dict.fromkeys(indicators))
 
     end_date = curr_date
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
+    # compute every indicator once for the whole window; only trading sessions are returned
+    try:
+        window = StockstatsUtils.get_stock_stats_window_batch(
+            symbol,
+            indicators,
+            before.strftime("%Y-%m-%d"),
+            end_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicators {indicators} from {before.strftime('%Y-%m-%d')} to {end_date}: {e}"
         )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
+        window = None
 
+    reports = []
+    for indicator in indicators:
         ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
+        if window is not None:
+            # most recent session first
+            ind_string = "".join(
+                f"{day:%Y-%m-%d}: {value}\n"
+                for day, value in window[indicator].iloc[::-1].items()
             )
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
-
-    result_str = (
-        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
-        + ind_string
-        + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
-    )
+        reports.append(
+            f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
+            + ind_string
+            + "\n\n"
+            + BEST_IND_PARAMS.get(indicator, "No description available.")
+        )
 
-    return result_str
+    return "\n\n".join(reports)
 
 
 def get_stockstats_indicator(
@@ -594,30 +552,19 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
+    # read in the file's rows through the shared price cache
+    data = load_price_rows(
+        symbol,
+        OFFLINE_DATA_RANGE,
         os.path.join(
             DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
+            f"market_data/price_data/{symbol}-YFin-data-{OFFLINE_DATA_RANGE}.csv",
+        ),
     )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-
-    # Set pandas display options to show the full DataFrame
-    with pd.option_context(
-        "display.max_rows", None, "display.max_columns", None, "display.width", None
-    ):
-        df_string = filtered_data.to_string()
+    filtered_data = price_rows_frame(slice_price_frame(data, before, date_obj))
+    df_string = format_price_frame(filtered_data)
 
     return (
         f"## 原始市場資料 for {symbol} from {start_date} to {curr_date}:\n\n"
@@ -671,85 +618,70 @@ def get_YFin_data(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
-) -> str:
-    # read in data
-    data = pd.read_csv(
+) -> pd.DataFrame:
+    """
+    Return the offline daily bars between start_date and end_date (inclusive)
+    as read from the CSV, Date strings included, numbered from 0.
+    """
+    # read in the file's rows through the shared price cache
+    data = load_price_rows(
+        symbol,
+        OFFLINE_DATA_RANGE,
         os.path.join(
             DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
+            f"market_data/price_data/{symbol}-YFin-data-{OFFLINE_DATA_RANGE}.csv",
+        ),
     )
 
-    if end_date > "2025-03-25":
-        raise Exception(
-            f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
+    if pd.Timestamp(end_date) > pd.Timestamp(OFFLINE_DATA_END):
+        raise ValueError(
+            f"Get_YFin_Data: {end_date} is outside of the data range of {OFFLINE_DATA_START} to {OFFLINE_DATA_END}"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = price_rows_frame(slice_price_frame(data, start_date, end_date))
 
     # remove the index from the dataframe
-    filtered_data = filtered_data.reset_index(drop=True)
-
-    return filtered_data
+    return filtered_data.reset_index(drop=True)
 
 
-def get_stock_news_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+# one pending call per cache key; later callers for the key wait on its future
+_openai_inflight: Dict[str, Future] = {}
+_openai_inflight_lock = threading.Lock()
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"你能搜尋社交媒體上關於 {ticker} 的討論，從 {curr_date} 前一個月到 {curr_date} 當月期間，對交易有幫助的討論嗎？請確保只獲取該期間內發布的數據。",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
 
+def _openai_search_text(config: dict, model: str, request: dict) -> str:
+    client = get_openai_client(config["backend_url"])
+    response = client.responses.create(model=model, **request)
     return response.output[1].content[0].text
 
 
-def get_global_news_openai(curr_date):
+def _openai_web_search(
+    function: Annotated[str, "name of the calling tool"],
+    ticker: Annotated[Optional[str], "ticker symbol, None for market-wide searches"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    prompt: Annotated[str, "system prompt of the search"],
+) -> str:
+    """
+    Run a web-search Responses API call and return its text. With
+    openai_cache enabled, the text is kept in the result cache under
+    (function, model, ticker, curr_date, hash of the request): permanently
+    for dates before today, for openai_cache_ttl seconds otherwise. While
+    a call for a key is running, other calls for the same key wait for its
+    result instead of searching again, so concurrent runs of several
+    tickers on one date search the global news only once; calls for
+    different keys never wait for each other.
+    """
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
-        model=config["quick_think_llm"],
+    model = config["quick_think_llm"]
+    request = dict(
         input=[
             {
                 "role": "system",
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"你能搜尋全球或宏觀經濟新聞，從 {curr_date} 前一個月到 {curr_date} 當月期間，對交易有幫助的新聞嗎？請確保只獲取該期間內發布的數據。",
+                        "text": prompt,
                     }
                 ],
             }
@@ -769,39 +701,75 @@ def get_global_news_openai(curr_date):
         store=True,
     )
 
-    return response.output[1].content[0].text
+    cache = get_result_cache() if config["openai_cache"] else None
+    request_hash = hashlib.sha256(
+        json.dumps([config["backend_url"], request], sort_keys=True).encode()
+    ).hexdigest()[:16]
+    key = f"{function}|{model}|{ticker or ''}|{curr_date}|{request_hash}"
 
+    # dates the LLM wrote in another format are cached with the TTL, never permanently
+    try:
+        historical = datetime.strptime(curr_date, "%Y-%m-%d").date() < date.today()
+    except (TypeError, ValueError):
+        historical = False
+    ttl = None if historical else config["openai_cache_ttl"]
+
+    if cache is None:
+        return _openai_search_text(config, model, request)
+
+    cached = cache.get("openai_web_search", key)
+    if cached is not None:
+        return cached
+
+    with _openai_inflight_lock:
+        pending = _openai_inflight.get(key)
+        if pending is None:
+            pending = _openai_inflight[key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return pending.result()
 
-def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    try:
+        # a call for the same key may have finished since the lookup above
+        text = cache.get("openai_web_search", key)
+        if text is None:
+            text = _openai_search_text(config, model, request)
+            cache.set("openai_web_search", key, text, ttl=ttl)
+        pending.set_result(text)
+    except Exception as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _openai_inflight_lock:
+            del _openai_inflight[key]
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"你能搜尋關於 {ticker} 在 {curr_date} 前一個月到 {curr_date} 當月期間的基本面討論嗎？請確保只獲取該期間內發布的數據。請以表格形式列出，包含本益比/市銷率/現金流等指標",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+    return text
+
+
+def get_stock_news_openai(ticker, curr_date):
+    return _openai_web_search(
+        "get_stock_news_openai",
+        ticker,
+        curr_date,
+        f"你能搜尋社交媒體上關於 {ticker} 的討論，從 {curr_date} 前一個月到 {curr_date} 當月期間，對交易有幫助的討論嗎？請確保只獲取該期間內發布的數據。",
     )
 
-    return response.output[1].content[0].text
+
+def get_global_news_openai(curr_date):
+    return _openai_web_search(
+        "get_global_news_openai",
+        None,
+        curr_date,
+        f"你能搜尋全球或宏觀經濟新聞，從 {curr_date} 前一個月到 {curr_date} 當月期間，對交易有幫助的新聞嗎？請確保只獲取該期間內發布的數據。",
+    )
+
+
+def get_fundamentals_openai(ticker, curr_date):
+    return _openai_web_search(
+        "get_fundamentals_openai",
+        ticker,
+        curr_date,
+        f"你能搜尋關於 {ticker} 在 {curr_date} 前一個月到 {curr_date} 當月期間的基本面討論嗎？請確保只獲取該期間內發布的數據。請以表格形式列出，包含本益比/市銷率/現金流等指標",
+    )
@@ -0,0 +1,95 @@
+import json
+from typing import Annotated, Any, Dict, Optional, Sequence, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Fastest installed parser; orjson and msgspec are optional and never required
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+else:
+    JSON_BACKEND = "json"
+
+
+def loads(data: Annotated[Union[bytes, str], "a JSON document"]) -> Any:
+    """Decode a JSON document with the fastest installed parser."""
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(data)
+    if JSON_BACKEND == "msgspec":
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def load_file(path: Annotated[str, "path of a JSON file"]) -> Any:
+    """Read and decode a whole JSON file, closing it before decoding."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return loads(data)
+
+
+class FieldDecoder:
+    """
+    Decoder for JSON objects that only need a few of their fields, e.g. the
+    lines of a Reddit dump. With msgspec installed the object is decoded
+    straight into a struct of those fields and every other field is skipped
+    without being materialized; otherwise the whole object is decoded with
+    the fastest installed parser and the fields are picked from it. Every
+    backend behaves the same on bad input: a missing field raises KeyError
+    with the field name, and a line that is not valid JSON (NaN and
+    Infinity included) or not an object raises ValueError.
+    """
+
+    def __init__(
+        self,
+        fields: Annotated[Sequence[str], "names of the fields to decode"],
+        backend: Annotated[
+            Optional[str], "'msgspec', 'orjson' or 'json', defaults to the fastest installed"
+        ] = None,
+    ):
+        self.fields = tuple(fields)
+        if backend is None:
+            backend = "msgspec" if msgspec is not None else JSON_BACKEND
+        self.backend = backend
+
+        if backend == "msgspec":
+            # UNSET defaults so a missing field is reported by name, not as a validation error
+            struct = msgspec.defstruct(
+                "Fields", [(field, Any, msgspec.UNSET) for field in self.fields]
+            )
+            self._decoder = msgspec.json.Decoder(struct)
+        elif backend == "orjson":
+            self._loads = orjson.loads
+        else:
+            self._loads = json.JSONDecoder(parse_constant=_reject_constant).decode
+
+    def decode(self, data: Annotated[Union[bytes, str], "one JSON object"]) -> Dict[str, Any]:
+        if self.backend == "msgspec":
+            try:
+                obj = self._decoder.decode(data)
+            except msgspec.ValidationError as e:
+                # the only remaining validation failure is a line that is not an object
+                raise ValueError(str(e)) from e
+            fields = {field: getattr(obj, field) for field in self.fields}
+            for field, value in fields.items():
+                if value is msgspec.UNSET:
+                    raise KeyError(field)
+            return fields
+        if self.backend == "json" and isinstance(data, bytes):
+            data = data.decode("utf-8")
+        obj = self._loads(data)
+        if not isinstance(obj, dict):
+            raise ValueError(f"Expected a JSON object, got {type(obj).__name__}")
+        return {field: obj[field] for field in self.fields}
+
+
+def _reject_constant(name: str):
+    raise ValueError(f"Invalid JSON constant {name}")
@@ -0,0 +1,216 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict, Optional, Union
+
+import pandas as pd
+
+from .config import get_config
+
+
+class PriceFrameCache:
+    """
+    Bounded, process-wide LRU cache of parsed price DataFrames.
+    Entries are keyed by (symbol, data range) and remember the mtime and size
+    of the file they were parsed from, so a rewritten file is parsed again. CSV files
+    are parsed by default; other formats pass their own loader. The
+    least recently used frames are evicted once the total in-memory size
+    exceeds max_bytes or the number of frames exceeds max_entries.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = 64):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._frames: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _parse_csv(path: str) -> pd.DataFrame:
+        """Parse a YFin price CSV into a frame indexed by trading date."""
+        data = pd.read_csv(path)
+        data["Date"] = pd.to_datetime(data["Date"].astype(str).str[:10])
+        return data.set_index("Date").sort_index()
+
+    @staticmethod
+    def _parse_csv_rows(path: str) -> pd.DataFrame:
+        """
+        Parse a YFin price CSV keeping every column exactly as read (the Date
+        strings with their UTC offsets included), indexed by trading date and
+        with each row's position in the file in a `Row` column.
+        """
+        data = pd.read_csv(path)
+        dates = pd.to_datetime(data["Date"].astype(str).str[:10])
+        data.insert(0, "Row", range(len(data)))
+        data.index = pd.DatetimeIndex(dates, name="DateOnly")
+        return data.sort_index(kind="mergesort")
+
+    def get(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_range: Annotated[str, "date range covered by the file, e.g. 2015-01-01-2025-03-25"],
+        path: Annotated[str, "path of the price file to parse on a miss"],
+        loader: Optional[Callable[[str], pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
+        """Return a copy of the date-indexed price frame, parsing the file on a miss."""
+        key = (symbol.upper(), data_range)
+        stat = os.stat(path)
+        mtime = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return entry[1].copy()
+            self.misses += 1
+
+        frame = (loader or self._parse_csv)(path)
+        self.put(symbol, data_range, frame, mtime)
+        return frame.copy()
+
+    def put(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_range: Annotated[str, "date range covered by the frame"],
+        frame: pd.DataFrame,
+        mtime: Optional[tuple] = None,
+    ) -> None:
+        """Insert a parsed frame and evict least recently used frames over budget."""
+        key = (symbol.upper(), data_range)
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+
+        with self._lock:
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[2]
+            if size > self.max_bytes:
+                # never keep a single frame larger than the whole budget
+                return
+            self._frames[key] = (mtime, frame, size)
+            self._total_bytes += size
+            while self._frames and (
+                self._total_bytes > self.max_bytes
+                or len(self._frames) > self.max_entries
+            ):
+                _, (_, _, evicted_size) = self._frames.popitem(last=False)
+                self._total_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached frame and reset the counters."""
+        with self._lock:
+            self._frames.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current cache footprint."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._frames),
+                "bytes": self._total_bytes,
+            }
+
+
+_price_cache: Optional[PriceFrameCache] = None
+_price_cache_lock = threading.Lock()
+
+
+def get_price_cache() -> PriceFrameCache:
+    """Return the shared price-frame cache, creating it from the config on first use."""
+    global _price_cache
+    with _price_cache_lock:
+        if _price_cache is None:
+            config = get_config()
+            _price_cache = PriceFrameCache(
+                max_bytes=int(config["price_cache_max_mb"] * 1024 * 1024),
+                max_entries=config["price_cache_max_entries"],
+            )
+        return _price_cache
+
+
+def load_price_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_range: Annotated[str, "date range covered by the file, e.g. 2015-01-01-2025-03-25"],
+    path: Annotated[str, "path of the price file"],
+    loader: Optional[Callable[[str], pd.DataFrame]] = None,
+) -> pd.DataFrame:
+    """Load a date-indexed price frame through the shared cache."""
+    return get_price_cache().get(symbol, data_range, path, loader)
+
+
+def load_frame(
+    name: Annotated[str, "what the frame holds, e.g. a ticker symbol"],
+    kind: Annotated[str, "kind of file, kept apart from price files, e.g. simfin-cash_flow-annual"],
+    path: Annotated[str, "path of the file"],
+    loader: Annotated[Callable[[str], pd.DataFrame], "parses the file into a frame"],
+) -> pd.DataFrame:
+    """
+    Load a frame that is not a price history through the shared cache, e.g.
+    a SimFin partition or an indicator matrix. It shares the memory budget
+    of the price frames and is reloaded when its file changes.
+    """
+    return get_price_cache().get(name, f"frame:{kind}", path, loader)
+
+
+def load_price_rows(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_range: Annotated[str, "date range covered by the file, e.g. 2015-01-01-2025-03-25"],
+    path: Annotated[str, "path of the YFin price CSV"],
+) -> pd.DataFrame:
+    """
+    Load the rows of a YFin CSV as read, through the shared cache, for tools
+    that print the file's own Date strings and row numbers. Slice the result
+    with slice_price_frame and restore the file layout with price_rows_frame.
+    """
+    return get_price_cache().get(
+        symbol, f"{data_range}:rows", path, PriceFrameCache._parse_csv_rows
+    )
+
+
+def price_rows_frame(
+    rows: Annotated[pd.DataFrame, "rows from load_price_rows, possibly sliced"],
+) -> pd.DataFrame:
+    """Return rows in file order, indexed by their row number in the file."""
+    return rows.sort_values("Row", kind="mergesort").set_index("Row").rename_axis(None)
+
+
+def slice_price_frame(
+    frame: Annotated[pd.DataFrame, "price frame with a sorted DatetimeIndex"],
+    start_date: Annotated[Union[str, pd.Timestamp], "first date of the range (inclusive)"],
+    end_date: Annotated[Union[str, pd.Timestamp], "last date of the range"],
+    inclusive_end: Annotated[bool, "whether bars dated end_date are included"] = True,
+) -> pd.DataFrame:
+    """
+    Return the rows of a date-indexed frame between two dates.
+    Both bounds are located with a binary search on the sorted index, so the
+    cost does not depend on the length of the history.
+    """
+    dates = frame.index
+    start = dates.searchsorted(pd.Timestamp(start_date), side="left")
+    stop = dates.searchsorted(
+        pd.Timestamp(end_date), side="right" if inclusive_end else "left"
+    )
+    return frame.iloc[start:stop]
+
+
+def format_price_frame(
+    frame: Annotated[pd.DataFrame, "typed price frame"],
+) -> str:
+    """
+    Render a price frame as a full-length table, without the row and column
+    truncation of the default DataFrame repr.
+    """
+    with pd.option_context(
+        "display.max_rows", None, "display.max_columns", None, "display.width", None
+    ):
+        return frame.to_string()
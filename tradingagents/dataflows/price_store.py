@@ -0,0 +1,297 @@
+import glob
+import os
+import threading
+from typing import Annotated, Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import yfinance as yf
+
+from .config import get_config
+from .price_cache import PriceFrameCache, load_price_frame, slice_price_frame
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+_write_lock = threading.Lock()
+
+
+class PriceStore:
+    """
+    Columnar, per-symbol store of daily price bars.
+    Each symbol lives in a single uncompressed Feather file under
+    `{data_cache_dir}/price_store`, with a typed datetime64 Date column
+    sorted ascending. New bars are only ever appended after the last stored
+    bar, and reads are memory-mapped and go through the shared price cache.
+    """
+
+    def __init__(
+        self,
+        root: Annotated[
+            Optional[str], "directory of the store, defaults to data_cache_dir/price_store"
+        ] = None,
+    ):
+        if root is None:
+            root = os.path.join(get_config()["data_cache_dir"], "price_store")
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, symbol: Annotated[str, "ticker symbol of the company"]) -> str:
+        return os.path.join(self.root, f"{symbol.upper()}.feather")
+
+    @staticmethod
+    def _read_file(path: str) -> pd.DataFrame:
+        """Memory-map a store file into a frame indexed by trading date."""
+        table = feather.read_table(path, memory_map=True)
+        return table.to_pandas().set_index("Date")
+
+    @staticmethod
+    def _normalize(bars: pd.DataFrame) -> pd.DataFrame:
+        """Coerce downloaded bars to a tz-naive, date-normalized Date column."""
+        if bars.empty:
+            return pd.DataFrame(
+                {"Date": pd.Series(dtype="datetime64[ns]")}
+                | {col: pd.Series(dtype="float64") for col in PRICE_COLUMNS}
+            )
+        bars = bars.reset_index() if "Date" not in bars.columns else bars.copy()
+        dates = pd.to_datetime(bars["Date"])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        bars["Date"] = dates.dt.normalize().astype("datetime64[ns]")
+        columns = ["Date"] + [col for col in PRICE_COLUMNS if col in bars.columns]
+        bars = bars[columns].dropna(subset=["Close"])
+        return bars.drop_duplicates("Date", keep="last").sort_values("Date")
+
+    def exists(self, symbol: Annotated[str, "ticker symbol of the company"]) -> bool:
+        return os.path.exists(self.path(symbol))
+
+    def read(self, symbol: Annotated[str, "ticker symbol of the company"]) -> pd.DataFrame:
+        """Return the stored history as a date-indexed frame."""
+        return load_price_frame(symbol, "price_store", self.path(symbol), self._read_file)
+
+    def metadata(self, symbol: Annotated[str, "ticker symbol of the company"]) -> dict:
+        """Return the key/value metadata saved with a symbol's file."""
+        with pa.memory_map(self.path(symbol)) as source:
+            schema = pa.ipc.open_file(source).schema
+        return {
+            key.decode(): value.decode()
+            for key, value in (schema.metadata or {}).items()
+            if not key.startswith(b"pandas")
+        }
+
+    def last_date(
+        self, symbol: Annotated[str, "ticker symbol of the company"]
+    ) -> Optional[pd.Timestamp]:
+        """Return the date of the last stored bar, or None for an unknown symbol."""
+        if not self.exists(symbol):
+            return None
+        dates = feather.read_table(
+            self.path(symbol), columns=["Date"], memory_map=True
+        ).column("Date")
+        if len(dates) == 0:
+            return None
+        return pd.Timestamp(dates[len(dates) - 1].as_py())
+
+    def is_refreshed(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        refresh_date: Annotated[str, "date of the refresh, YYYY-mm-dd"],
+    ) -> bool:
+        """Check whether a symbol was already refreshed on refresh_date."""
+        return (
+            self.exists(symbol)
+            and self.metadata(symbol).get("refreshed") == refresh_date
+        )
+
+    def append(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        bars: Annotated[pd.DataFrame, "new daily bars with a Date column or index"],
+        **metadata,
+    ) -> int:
+        """
+        Append bars dated after the last stored bar and return how many were added.
+        Bars at or before the last stored date are ignored, so history is never
+        rewritten. Extra keyword arguments are saved as file metadata.
+        """
+        with _write_lock:
+            return self._append(symbol, self._normalize(bars), metadata)
+
+    def replace(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        bars: Annotated[pd.DataFrame, "full daily history with a Date column or index"],
+        **metadata,
+    ) -> int:
+        """Overwrite a symbol's whole history and return the number of stored bars."""
+        bars = self._normalize(bars)
+        with _write_lock:
+            self._write(symbol, bars, metadata)
+        return len(bars)
+
+    def refresh(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        end_date: Annotated[str, "exclusive end date of the refresh, YYYY-mm-dd"],
+        downloader: Annotated[
+            Optional[Callable[[str, str, str], pd.DataFrame]],
+            "callable (symbol, start_date, end_date) returning daily bars, defaults to yfinance",
+        ] = None,
+        mode: Annotated[
+            Optional[str], "'incremental' or 'full', defaults to config price_refresh_mode"
+        ] = None,
+    ) -> int:
+        """
+        Bring a symbol's history up to end_date and return the number of new bars.
+        In incremental mode only the tail after the last stored bar is fetched.
+        The download starts at the last stored bar so its close can be compared;
+        when it no longer matches (a split or dividend re-adjusted the series),
+        the full history is downloaded again instead.
+        """
+        downloader = downloader or yfinance_downloader
+        start_date, incremental = self.refresh_start(symbol, end_date, mode)
+
+        if incremental:
+            added = self.merge_tail(
+                symbol, downloader(symbol, start_date, end_date), end_date
+            )
+            if added is not None:
+                return added
+            start_date, _ = self.refresh_start(symbol, end_date, "full")
+
+        return self.merge_full(symbol, downloader(symbol, start_date, end_date), end_date)
+
+    def refresh_start(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        end_date: Annotated[str, "exclusive end date of the refresh, YYYY-mm-dd"],
+        mode: Annotated[
+            Optional[str], "'incremental' or 'full', defaults to config price_refresh_mode"
+        ] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Return the date a refresh has to download from, and whether that
+        download is an incremental tail (starting at the last stored bar).
+        """
+        config = get_config()
+        mode = mode or config["price_refresh_mode"]
+        last_date = self.last_date(symbol)
+        if mode == "incremental" and last_date is not None:
+            return last_date.strftime("%Y-%m-%d"), True
+
+        full_start = pd.Timestamp(end_date) - pd.DateOffset(
+            years=config["price_history_years"]
+        )
+        return full_start.strftime("%Y-%m-%d"), False
+
+    def merge_tail(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        tail: Annotated[pd.DataFrame, "bars downloaded from the last stored bar on"],
+        end_date: Annotated[str, "exclusive end date of the refresh, YYYY-mm-dd"],
+    ) -> Optional[int]:
+        """
+        Append an incremental tail and return the number of new bars, or None
+        when the overlapping bar no longer matches the stored close (the
+        series was re-adjusted) and the full history has to be downloaded.
+        """
+        tail = self._normalize(tail)
+        if tail.empty:
+            # an empty download may be a transient failure: leave the symbol unrefreshed
+            return 0
+        last_date = self.last_date(symbol)
+        stored_close = self.read(symbol)["Close"].iloc[-1]
+        overlap = tail[tail["Date"] == last_date]
+        if overlap.empty or np.isclose(overlap["Close"].iloc[0], stored_close):
+            return self.append(symbol, tail, refreshed=end_date)
+        return None
+
+    def merge_full(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        bars: Annotated[pd.DataFrame, "full downloaded history"],
+        end_date: Annotated[str, "exclusive end date of the refresh, YYYY-mm-dd"],
+    ) -> int:
+        """
+        Replace the stored history with a full download and return the number
+        of new bars. An empty download writes nothing and does not mark the
+        symbol as refreshed, so it is retried on the next call.
+        """
+        if bars.empty:
+            return 0
+        last_date = self.last_date(symbol)
+        stored_bars = 0 if last_date is None else len(self.read(symbol))
+        return max(0, self.replace(symbol, bars, refreshed=end_date) - stored_bars)
+
+    def _append(self, symbol: str, bars: pd.DataFrame, metadata: dict) -> int:
+        last_date = self.last_date(symbol)
+
+        if last_date is not None:
+            stored = self.read(symbol).reset_index()
+            bars = bars[bars["Date"] > last_date]
+            combined = pd.concat([stored, bars], ignore_index=True)
+            metadata = {**self.metadata(symbol), **metadata}
+        else:
+            combined = bars
+
+        self._write(symbol, combined, metadata)
+        return len(bars)
+
+    def _write(self, symbol: str, frame: pd.DataFrame, metadata: dict) -> None:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                **{key: str(value) for key, value in metadata.items()},
+            }
+        )
+
+        # write to a temporary file first so readers never see a partial file
+        tmp_path = self.path(symbol) + ".tmp"
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, self.path(symbol))
+
+
+def yfinance_downloader(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "start date, YYYY-mm-dd"],
+    end_date: Annotated[str, "exclusive end date, YYYY-mm-dd"],
+) -> pd.DataFrame:
+    """Download adjusted daily bars from Yahoo Finance."""
+    return yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+
+
+class LocalCSVDownloader:
+    """
+    Stand-in downloader that serves bars from YFin CSV files on disk.
+    Useful for tests and offline runs: it answers the same (symbol, start,
+    end) calls as yfinance_downloader from `{symbol}-YFin-data-*.csv` files
+    in data_dir, and records every call in `calls`.
+    """
+
+    def __init__(self, data_dir: Annotated[str, "directory holding YFin CSV files"]):
+        self.data_dir = data_dir
+        self.calls = []
+
+    def __call__(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        start_date: Annotated[str, "start date, YYYY-mm-dd"],
+        end_date: Annotated[str, "exclusive end date, YYYY-mm-dd"],
+    ) -> pd.DataFrame:
+        self.calls.append((symbol, start_date, end_date))
+        paths = sorted(glob.glob(os.path.join(self.data_dir, f"{symbol}-YFin-data-*.csv")))
+        if not paths:
+            return pd.DataFrame(columns=["Date"] + PRICE_COLUMNS)
+        data = PriceFrameCache._parse_csv(paths[-1])
+        return slice_price_frame(
+            data, start_date, end_date, inclusive_end=False
+        ).reset_index()
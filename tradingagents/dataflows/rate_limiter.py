@@ -0,0 +1,46 @@
+import threading
+import time
+from typing import Annotated
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    Tokens refill continuously at `rate` per second up to `capacity`, and
+    every request takes one. A caller that finds the bucket empty reserves
+    the next token and sleeps until it is due, so concurrent callers are
+    served in arrival order and the long-run request rate never exceeds
+    `rate`, however many threads share the bucket.
+    """
+
+    def __init__(
+        self,
+        rate: Annotated[float, "tokens added per second"],
+        capacity: Annotated[float, "maximum burst size"] = 1,
+    ):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive.")
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available, and return the time slept."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquired += 1
+            self.waited_seconds += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
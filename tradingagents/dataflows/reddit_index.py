@@ -0,0 +1,178 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Annotated, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+from .json_codec import FieldDecoder
+
+_SECONDS_PER_DAY = 86400
+_EPOCH_DAY = np.datetime64("1970-01-01", "D")
+_created_utc_decoder = FieldDecoder(("created_utc",))
+
+
+def _day_number(date: str) -> int:
+    """Days since the Unix epoch of a yyyy-mm-dd date."""
+    return int((np.datetime64(date, "D") - _EPOCH_DAY).astype(int))
+
+
+class RedditDayIndex:
+    """
+    Byte-offset index of a subreddit `.jsonl` dump, grouped by UTC day.
+    The file is scanned once to record the offset, length and posting day
+    of every line. Offsets are stored sorted by day (keeping file order
+    within a day), so the lines of a day or a range of days are located
+    with a binary search and read with direct seeks instead of parsing the
+    whole file.
+    """
+
+    def __init__(
+        self,
+        path: Annotated[str, "path of the .jsonl file"],
+        days: Annotated[np.ndarray, "UTC day number of each line, sorted"],
+        offsets: Annotated[np.ndarray, "byte offset of each line"],
+        lengths: Annotated[np.ndarray, "byte length of each line"],
+    ):
+        self.path = path
+        self.days = days
+        self.offsets = offsets
+        self.lengths = lengths
+
+    @classmethod
+    def build(cls, path: Annotated[str, "path of the .jsonl file"]) -> "RedditDayIndex":
+        """Scan a .jsonl file once and index every non-empty line by its UTC day."""
+        days, offsets, lengths = [], [], []
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    created_utc = _created_utc_decoder.decode(line)["created_utc"]
+                    days.append(int(float(created_utc)) // _SECONDS_PER_DAY)
+                    offsets.append(offset)
+                    lengths.append(len(line))
+                offset += len(line)
+
+        days = np.asarray(days, dtype=np.int64)
+        order = np.argsort(days, kind="stable")
+        return cls(
+            path,
+            days[order],
+            np.asarray(offsets, dtype=np.int64)[order],
+            np.asarray(lengths, dtype=np.int64)[order],
+        )
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def positions(
+        self,
+        start_date: Annotated[str, "first day, yyyy-mm-dd (inclusive)"],
+        end_date: Annotated[str, "last day, yyyy-mm-dd (inclusive)"],
+    ) -> Tuple[int, int]:
+        """Return the [start, stop) positions of the lines posted inside the range."""
+        start = np.searchsorted(self.days, _day_number(start_date), side="left")
+        stop = np.searchsorted(self.days, _day_number(end_date), side="right")
+        return int(start), int(stop)
+
+    def lines(
+        self,
+        start_date: Annotated[str, "first day, yyyy-mm-dd (inclusive)"],
+        end_date: Annotated[Optional[str], "last day, defaults to start_date"] = None,
+    ) -> Iterator[bytes]:
+        """Yield the raw lines posted between start_date and end_date, day by day in file order."""
+        start, stop = self.positions(start_date, end_date or start_date)
+        if start == stop:
+            return
+        with open(self.path, "rb") as f:
+            for offset, length in zip(self.offsets[start:stop], self.lengths[start:stop]):
+                f.seek(int(offset))
+                yield f.read(int(length))
+
+    def lines_by_day(
+        self,
+        start_date: Annotated[str, "first day, yyyy-mm-dd (inclusive)"],
+        end_date: Annotated[str, "last day, yyyy-mm-dd (inclusive)"],
+    ) -> Iterator[Tuple[str, List[bytes]]]:
+        """Yield (yyyy-mm-dd, raw lines in file order) for every day of the range that has posts."""
+        start, stop = self.positions(start_date, end_date)
+        if start == stop:
+            return
+        days = self.days[start:stop]
+        # boundaries between days inside the already sorted slice
+        bounds = np.flatnonzero(np.diff(days)) + 1
+        with open(self.path, "rb") as f:
+            for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(days)]):
+                day = str(_EPOCH_DAY + np.timedelta64(int(days[lo]), "D"))
+                lines = []
+                for offset, length in zip(
+                    self.offsets[start + lo : start + hi],
+                    self.lengths[start + lo : start + hi],
+                ):
+                    f.seek(int(offset))
+                    lines.append(f.read(int(length)))
+                yield day, lines
+
+    def save(self, index_path: str, version: tuple) -> None:
+        tmp_path = index_path + ".tmp.npz"
+        np.savez(
+            tmp_path,
+            days=self.days,
+            offsets=self.offsets,
+            lengths=self.lengths,
+            version=np.asarray(version, dtype=np.int64),
+        )
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load(cls, path: str, index_path: str, version: tuple) -> Optional["RedditDayIndex"]:
+        """Load a saved index, or return None when it is missing or was built from another version of the file."""
+        if not os.path.exists(index_path):
+            return None
+        with np.load(index_path) as saved:
+            if tuple(saved["version"].tolist()) != version:
+                return None
+            return cls(path, saved["days"], saved["offsets"], saved["lengths"])
+
+
+_indexes: "OrderedDict[str, Tuple[tuple, RedditDayIndex]]" = OrderedDict()
+_indexes_lock = threading.Lock()
+_MAX_INDEXES = 256
+
+
+def get_reddit_day_index(
+    path: Annotated[str, "path of the .jsonl file"],
+) -> RedditDayIndex:
+    """
+    Return the day index of a subreddit file. Indexes are kept in memory and
+    saved under `{data_cache_dir}/reddit_index`; they are rebuilt only when
+    the file's mtime or size changes.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _indexes_lock:
+        entry = _indexes.get(path)
+        if entry is not None and entry[0] == version:
+            _indexes.move_to_end(path)
+            return entry[1]
+
+    index_dir = os.path.join(get_config()["data_cache_dir"], "reddit_index")
+    os.makedirs(index_dir, exist_ok=True)
+    digest = hashlib.md5(path.encode()).hexdigest()[:12]
+    index_path = os.path.join(index_dir, f"{os.path.basename(path)}-{digest}.npz")
+
+    index = RedditDayIndex.load(path, index_path, version)
+    if index is None:
+        index = RedditDayIndex.build(path)
+        index.save(index_path, version)
+
+    with _indexes_lock:
+        _indexes[path] = (version, index)
+        _indexes.move_to_end(path)
+        while len(_indexes) > _MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
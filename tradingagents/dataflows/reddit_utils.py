@@ -1,11 +1,14 @@
-import requests
-import time
-import json
-from datetime import datetime, timedelta
-from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, List
 import os
 import re
+import heapq
+from collections import defaultdict
+from .json_codec import FieldDecoder
+from .reddit_index import get_reddit_day_index
+
+# the only fields of a Reddit post the news tools use
+_reddit_post_decoder = FieldDecoder(("created_utc", "title", "selftext", "url", "ups"))
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,6 +52,57 @@ ticker_to_company = {
 }
 
 
+class CompanyMatcher:
+    """
+    Compiled search for a company's terms in Reddit posts.
+    All terms of a ticker are joined into one case-insensitive alternation
+    that is compiled once. Raw JSON lines are checked first with a cheap
+    prefilter on the lower-cased bytes (plain substring tests when every
+    term is a literal): a line it rejects cannot mention the company in its
+    title or selftext, so it never has to be decoded.
+    """
+
+    def __init__(self, terms: Annotated[List[str], "regex terms, any of which must match"]):
+        pattern = "|".join(f"(?:{term})" for term in terms)
+        self._text = re.compile(pattern, re.IGNORECASE)
+
+        self._literals = None
+        self._raw = None
+        if all(re.fullmatch(r"[A-Za-z0-9 &'-]+", term) for term in terms):
+            self._literals = [term.lower().encode() for term in terms]
+        elif pattern.isascii() and "\\" not in pattern:
+            self._raw = re.compile(pattern.lower().encode())
+        else:
+            self._raw = re.compile(pattern.encode(), re.IGNORECASE)
+
+    def may_match(self, line: Annotated[bytes, "raw JSON line"]) -> bool:
+        if self._literals is not None:
+            line = line.lower()
+            return any(literal in line for literal in self._literals)
+        if self._raw.flags & re.IGNORECASE:
+            return self._raw.search(line) is not None
+        return self._raw.search(line.lower()) is not None
+
+    def matches(self, post: Annotated[dict, "decoded Reddit post"]) -> bool:
+        return bool(
+            self._text.search(post["title"]) or self._text.search(post["selftext"])
+        )
+
+
+@lru_cache(maxsize=None)
+def company_matcher(
+    ticker: Annotated[str, "ticker symbol of the company"],
+) -> CompanyMatcher:
+    """Return the cached matcher for the company names and ticker of a symbol."""
+    if "OR" in ticker_to_company[ticker]:
+        search_terms = ticker_to_company[ticker].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[ticker]]
+
+    search_terms.append(ticker)
+    return CompanyMatcher(search_terms)
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -61,61 +115,67 @@ def fetch_top_from_category(
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path
+    )
+
+
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit_per_day: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """
+    Fetch the top posts of every day in a date range with one pass per
+    subreddit file. Posts are bucketed by day while the file is read, and
+    the top posts by upvotes of each (day, subreddit) are picked with a
+    heap. The result is ordered like calling fetch_top_from_category for
+    each day in turn.
+    """
     base_path = data_path
 
-    all_content = []
+    data_files = os.listdir(os.path.join(base_path, category))
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit_per_day < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit_per_day // len(data_files)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    matcher = company_matcher(query) if "company" in category and query else None
+
+    # day -> top posts of each subreddit, in file order
+    top_per_day = defaultdict(list)
+
+    for data_file in data_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
+        # seek straight to the lines posted in the range, grouped by day, instead of parsing the whole file
+        index = get_reddit_day_index(os.path.join(base_path, category, data_file))
+        for post_date, lines in index.lines_by_day(start_date, end_date):
+            posts = []
+            for line in lines:
+                # the date filter already ran through the index; cheaply reject
+                # lines that cannot mention the company before decoding them
+                if matcher is not None and not matcher.may_match(line):
                     continue
 
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+                parsed_line = _reddit_post_decoder.decode(line)
 
                 # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
+                if matcher is not None and not matcher.matches(parsed_line):
+                    continue
 
                 post = {
                     "title": parsed_line["title"],
@@ -125,11 +185,15 @@ def fetch_top_from_category(
                     "posted_date": post_date,
                 }
 
-                all_content_curr_subreddit.append(post)
+                posts.append(post)
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+            # most upvoted first; heapq.nlargest keeps file order among ties
+            top_per_day[post_date].extend(
+                heapq.nlargest(limit_per_subreddit, posts, key=lambda x: x["upvotes"])
+            )
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+    all_content = []
+    for post_date in sorted(top_per_day):
+        all_content.extend(top_per_day[post_date])
 
     return all_content
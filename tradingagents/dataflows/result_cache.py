@@ -0,0 +1,126 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Annotated, Any, Dict, Optional
+
+from .config import get_config
+from .json_codec import loads
+
+_write_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created REAL NOT NULL,
+    expires REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
+
+
+class ResultCache:
+    """
+    Persistent SQLite cache of JSON-serializable results of network calls.
+    Entries are keyed by (namespace, key). An entry stored with a TTL is
+    ignored once it has expired and is replaced by the next `set`; an entry
+    stored without one never expires, which suits results that can no
+    longer change, such as searches over a fully historical date window.
+    """
+
+    def __init__(
+        self,
+        path: Annotated[
+            Optional[str],
+            "SQLite database file, defaults to data_cache_dir/result_cache.sqlite",
+        ] = None,
+    ):
+        if path is None:
+            path = os.path.join(get_config()["data_cache_dir"], "result_cache.sqlite")
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(
+        self,
+        namespace: Annotated[str, "kind of result, e.g. google_news"],
+        key: Annotated[str, "normalized request key"],
+    ) -> Optional[Any]:
+        """Return the stored result, or None when it is missing or expired."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, expires FROM results WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return loads(row[0])
+
+    def set(
+        self,
+        namespace: Annotated[str, "kind of result, e.g. google_news"],
+        key: Annotated[str, "normalized request key"],
+        value: Annotated[Any, "JSON-serializable result"],
+        ttl: Annotated[Optional[float], "seconds until the entry expires, None for never"] = None,
+    ) -> None:
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with _write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), now, expires),
+            )
+
+    def clear(
+        self,
+        namespace: Annotated[Optional[str], "namespace to clear, None for all"] = None,
+        expired_only: Annotated[bool, "only drop entries whose TTL has passed"] = False,
+    ) -> int:
+        """Delete entries and return how many were removed."""
+        query, params = "DELETE FROM results WHERE 1 = 1", []
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params.append(namespace)
+        if expired_only:
+            query += " AND expires IS NOT NULL AND expires <= ?"
+            params.append(time.time())
+        with _write_lock, self._connect() as conn:
+            return conn.execute(query, params).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
+
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Return the shared result cache for the configured data_cache_dir."""
+    path = os.path.join(get_config()["data_cache_dir"], "result_cache.sqlite")
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResultCache(path)
+        return _caches[path]
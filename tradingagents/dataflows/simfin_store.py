@@ -0,0 +1,231 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Annotated, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from .config import get_config
+from .price_cache import load_frame
+
+# statement name -> (directory under simfin_data_all, file prefix)
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "balance"),
+    "cash_flow": ("cash_flow", "cashflow"),
+    "income_statements": ("income_statements", "income"),
+}
+
+# held while partitions are swapped in and while they are looked up, so a
+# reader sees either the old or the new partitions, never a missing one
+_swap_lock = threading.Lock()
+# held across the freshness check and the ingest, so a CSV is ingested once
+_ingest_lock = threading.Lock()
+
+
+def simfin_csv_path(
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "annual / quarterly"],
+    data_dir: Annotated[str, "directory where the data is saved"],
+) -> str:
+    """Return the path of the US-wide SimFin CSV file of a statement."""
+    directory, prefix = SIMFIN_STATEMENTS[statement]
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        directory,
+        "companies",
+        "us",
+        f"us-{prefix}-{freq}.csv",
+    )
+
+
+class SimFinStore:
+    """
+    Per-ticker partitioned store of the SimFin fundamentals.
+    The US-wide CSV of each (statement, freq) is parsed once and split into
+    one uncompressed Feather file per ticker under
+    `{data_cache_dir}/simfin_store/{statement}-{freq}`, with typed UTC
+    Report/Publish Date columns and rows sorted by Publish Date. Looking up
+    a ticker's statement then reads only that ticker's rows. The mtime and
+    size of the source CSV are recorded, and a changed CSV is ingested again.
+    """
+
+    def __init__(
+        self,
+        root: Annotated[
+            Optional[str], "directory of the store, defaults to data_cache_dir/simfin_store"
+        ] = None,
+    ):
+        if root is None:
+            root = os.path.join(get_config()["data_cache_dir"], "simfin_store")
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def partition_dir(self, statement: str, freq: str) -> str:
+        return os.path.join(self.root, f"{statement}-{freq}")
+
+    def path(self, statement: str, freq: str, ticker: str) -> str:
+        return os.path.join(self.partition_dir(statement, freq), f"{ticker}.feather")
+
+    @staticmethod
+    def _read_file(path: str) -> pd.DataFrame:
+        return feather.read_table(path, memory_map=True).to_pandas()
+
+    def _manifest(self, statement: str, freq: str) -> Optional[dict]:
+        manifest_path = os.path.join(self.partition_dir(statement, freq), "_manifest.json")
+        with _swap_lock:
+            if not os.path.exists(manifest_path):
+                return None
+            with open(manifest_path, "r") as f:
+                return json.load(f)
+
+    def is_ingested(
+        self,
+        statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+        freq: Annotated[str, "annual / quarterly"],
+        data_dir: Annotated[str, "directory where the data is saved"],
+    ) -> bool:
+        """
+        Check whether the store holds the current version of a SimFin CSV.
+        When the CSV was removed after ingestion, the stored partitions are
+        treated as current.
+        """
+        manifest = self._manifest(statement, freq)
+        if manifest is None:
+            return False
+        csv_path = simfin_csv_path(statement, freq, data_dir)
+        if not os.path.exists(csv_path):
+            return True
+        stat = os.stat(csv_path)
+        return [manifest["mtime_ns"], manifest["size"]] == [stat.st_mtime_ns, stat.st_size]
+
+    def ingest(
+        self,
+        statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+        freq: Annotated[str, "annual / quarterly"],
+        data_dir: Annotated[str, "directory where the data is saved"],
+    ) -> int:
+        """Partition one SimFin CSV by ticker and return the number of tickers stored."""
+        csv_path = simfin_csv_path(statement, freq, data_dir)
+        stat = os.stat(csv_path)
+        df = pd.read_csv(csv_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+        # stable sort so reports published on the same day keep their file order
+        df = df.sort_values(["Ticker", "Publish Date"], kind="mergesort")
+
+        # build the new partitions next to the old ones, then swap them in
+        target = self.partition_dir(statement, freq)
+        staging = tempfile.mkdtemp(prefix=f"{statement}-{freq}.staging-", dir=self.root)
+        tickers = 0
+        for ticker, rows in df.groupby("Ticker", sort=False):
+            table = pa.Table.from_pandas(rows, preserve_index=True)
+            feather.write_feather(
+                table,
+                os.path.join(staging, f"{ticker}.feather"),
+                compression="uncompressed",
+            )
+            tickers += 1
+        with open(os.path.join(staging, "_manifest.json"), "w") as f:
+            json.dump(
+                {"source": csv_path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size},
+                f,
+            )
+
+        retired = staging + ".old"
+        with _swap_lock:
+            if os.path.exists(target):
+                os.replace(target, retired)
+            os.replace(staging, target)
+        shutil.rmtree(retired, ignore_errors=True)
+        return tickers
+
+    def read(
+        self,
+        statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+        freq: Annotated[str, "annual / quarterly"],
+        ticker: Annotated[str, "ticker symbol"],
+    ) -> pd.DataFrame:
+        """Return a ticker's statements sorted by Publish Date, or an empty frame for an unknown ticker."""
+        path = self.path(statement, freq, ticker)
+        with _swap_lock:
+            if not os.path.exists(path):
+                return pd.DataFrame()
+            return load_frame(ticker, f"simfin-{statement}-{freq}", path, self._read_file)
+
+    def latest(
+        self,
+        statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+        freq: Annotated[str, "annual / quarterly"],
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """
+        Return the most recent statement published on or before curr_date, or
+        None when there is none. The row is found with a binary search on the
+        sorted Publish Date column; among reports published on the same day
+        the first one in the source file is returned.
+        """
+        rows = self.read(statement, freq, ticker)
+        if rows.empty:
+            return None
+
+        dates = rows["Publish Date"]
+        stop = dates.searchsorted(pd.to_datetime(curr_date, utc=True).normalize(), side="right")
+        if stop == 0:
+            return None
+        first = dates.searchsorted(dates.iloc[stop - 1], side="left")
+        return rows.iloc[first]
+
+    def as_of(
+        self,
+        statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+        freq: Annotated[str, "annual / quarterly"],
+        ticker: Annotated[str, "ticker symbol"],
+        dates: Annotated[Sequence, "trade dates, yyyy-mm-dd strings or timestamps"],
+    ) -> pd.DataFrame:
+        """
+        Return, for every date, the most recent statement published on or
+        before it, as one row per input date in the input order. The lookup is
+        a single backward merge_asof of the sorted dates against the ticker's
+        sorted statements; dates with no statement yet get a row of NaN.
+        """
+        as_of_dates = pd.Series(
+            pd.to_datetime(list(dates), utc=True).normalize(), name="As Of Date"
+        )
+        rows = self.read(statement, freq, ticker)
+        if rows.empty:
+            return pd.DataFrame(index=pd.Index(as_of_dates, name="As Of Date"))
+
+        # same tie-break as latest(): the first report of a publish day wins
+        rows = rows.drop_duplicates("Publish Date", keep="first").reset_index(drop=True)
+        order = as_of_dates.sort_values(kind="mergesort")
+        merged = pd.merge_asof(
+            order.to_frame(),
+            rows,
+            left_on="As Of Date",
+            right_on="Publish Date",
+            direction="backward",
+        )
+        merged.index = order.index
+        return merged.sort_index().set_index("As Of Date")
+
+
+def load_simfin_store(
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "annual / quarterly"],
+    data_dir: Annotated[str, "directory where the data is saved"],
+) -> SimFinStore:
+    """Return the SimFin store, ingesting the statement's CSV first if it is new or changed."""
+    store = SimFinStore()
+    with _ingest_lock:
+        if not store.is_ingested(statement, freq, data_dir):
+            store.ingest(statement, freq, data_dir)
+    return store
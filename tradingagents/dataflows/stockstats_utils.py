@@ -1,21 +1,109 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
 from .config import get_config
+from .indicator_engine import SUPPORTED_INDICATORS, compute_indicators
+from .indicator_store import IndicatorStore, file_signature
+from .price_cache import load_price_frame
+from .price_store import PriceStore
+from .trading_calendar import get_trading_calendar
+
+# Date range of the offline YFin price files in data_dir
+OFFLINE_DATA_RANGE = "2015-01-01-2025-03-25"
+OFFLINE_DATA_START, OFFLINE_DATA_END = OFFLINE_DATA_RANGE[:10], OFFLINE_DATA_RANGE[11:]
+
+
+# Supported stockstats indicators and the guidance attached to their reports
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
 
 
 class StockstatsUtils:
     @staticmethod
-    def get_stock_stats(
+    def _price_path(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[str, "directory where the stock data is stored."],
+        online: Annotated[bool, "whether the price data comes from the online price store"] = False,
+    ) -> str:
+        """Return the file the price history of a symbol is read from."""
+        if online:
+            return PriceStore().path(symbol)
+        return os.path.join(data_dir, f"{symbol}-YFin-data-{OFFLINE_DATA_RANGE}.csv")
+
+    @staticmethod
+    def _load_price_data(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
         data_dir: Annotated[
             str,
             "directory where the stock data is stored.",
@@ -24,64 +112,180 @@ class StockstatsUtils:
             bool,
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
-    ):
-        df = None
-        data = None
-
+    ) -> pd.DataFrame:
+        """Load the price history used for indicator computation through the shared price cache."""
         if not online:
             try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
+                data = load_price_frame(
+                    symbol,
+                    OFFLINE_DATA_RANGE,
+                    StockstatsUtils._price_path(symbol, data_dir),
                 )
-                df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
+            # Keep one columnar history per symbol and refresh it at most once a day
+            store = PriceStore()
+            refresh_date = pd.Timestamp.today().strftime("%Y-%m-%d")
+            if not store.is_refreshed(symbol, refresh_date):
+                store.refresh(symbol, refresh_date)
+            if not store.exists(symbol):
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+            data = store.read(symbol)
 
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+        return data.reset_index()
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+    @staticmethod
+    def _compute_indicators(
+        data: Annotated[pd.DataFrame, "price data with a datetime Date column"],
+        indicators: Annotated[list, "stockstats indicators to compute"],
+    ) -> pd.DataFrame:
+        """
+        Compute every indicator on a single pass over the price data, using the
+        NumPy engine when indicator_engine is "numpy" and it supports them all.
+        """
+        if get_config()["indicator_engine"] == "numpy" and all(
+            indicator in SUPPORTED_INDICATORS for indicator in indicators
+        ):
+            return compute_indicators(data, indicators)
+
+        df = wrap(data)
+        for indicator in indicators:
+            df[indicator]  # trigger stockstats to calculate the indicator
+        frame = pd.DataFrame(
+            {indicator: df[indicator].values for indicator in indicators},
+            index=pd.DatetimeIndex(data["Date"], name="Date"),
+        )
+        return frame
+
+    @staticmethod
+    def _indicator_frame(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[list, "stockstats indicators to compute"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Return a date-indexed frame with one column per indicator.
+        With precompute_indicators enabled, supported indicators are read from
+        the persisted indicator matrix instead of being recomputed.
+        """
+        # taken before the read, so a file rewritten meanwhile is hashed again next time
+        price_path = StockstatsUtils._price_path(symbol, data_dir, online)
+        price_signature = file_signature(price_path)
+        data = StockstatsUtils._load_price_data(symbol, data_dir, online)
+
+        if get_config()["precompute_indicators"] and all(
+            indicator in BEST_IND_PARAMS for indicator in indicators
+        ):
+            matrix = IndicatorStore().get_matrix(
+                symbol,
+                ("price_store" if online else OFFLINE_DATA_RANGE)
+                + f"-{get_config()['indicator_engine']}",
+                data,
+                list(BEST_IND_PARAMS),
+                StockstatsUtils._compute_indicators,
+                price_path,
+                price_signature,
+            )
+            return matrix[indicators]
+
+        return StockstatsUtils._compute_indicators(data, indicators)
+
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        values = StockstatsUtils._indicator_frame(
+            symbol, [indicator], data_dir, online
+        )[indicator]
+        calendar = get_trading_calendar(
+            symbol, "online" if online else OFFLINE_DATA_RANGE, values.index
+        )
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        start, stop = calendar.positions(curr_date, curr_date)
+        if stop > start:
+            indicator_value = values.iloc[start]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Compute an indicator over a whole date window in one pass.
+        Returns a Series of indicator values indexed by trading date.
+        """
+        return StockstatsUtils.get_stock_stats_window_batch(
+            symbol, [indicator], start_date, end_date, data_dir, online
+        )[indicator]
+
+    @staticmethod
+    def get_stock_stats_window_batch(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            list,
+            "quantitative indicators based off of the stock data for the company",
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Compute several indicators over a whole date window in one pass.
+        The price history is loaded and wrapped once, every indicator column is
+        computed on that single frame, and the window is located on the
+        symbol's trading calendar with a binary search. Returns a DataFrame
+        with one column per indicator and one row per trading session, keeping
+        the DatetimeIndex so callers decide how dates are formatted.
+        """
+        frame = StockstatsUtils._indicator_frame(symbol, indicators, data_dir, online)
+        calendar = get_trading_calendar(
+            symbol, "online" if online else OFFLINE_DATA_RANGE, frame.index
+        )
+
+        start, stop = calendar.positions(start_date, end_date)
+        return frame.iloc[start:stop].copy()
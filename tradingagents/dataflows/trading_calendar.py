@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+from typing import Annotated, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+DateLike = Union[str, pd.Timestamp, np.datetime64]
+
+
+class TradingCalendar:
+    """
+    Sorted array of trading sessions built from price data.
+    Range lookups use binary search on the session array instead of
+    scanning date strings, and ranges only ever cover days the market was
+    open.
+    """
+
+    def __init__(self, sessions: Annotated[np.ndarray, "trading dates"]):
+        self._sessions = np.unique(np.asarray(sessions, dtype="datetime64[D]"))
+
+    @classmethod
+    def from_dates(
+        cls, dates: Annotated[Union[pd.Series, pd.Index], "trading dates of the price data"]
+    ) -> "TradingCalendar":
+        return cls(pd.DatetimeIndex(dates).tz_localize(None).values)
+
+    @staticmethod
+    def _to_day(date: DateLike) -> np.datetime64:
+        return np.datetime64(pd.Timestamp(date).date(), "D")
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def positions(
+        self,
+        start_date: Annotated[DateLike, "first date of the range (inclusive)"],
+        end_date: Annotated[DateLike, "last date of the range (inclusive)"],
+    ) -> Tuple[int, int]:
+        """Return the [start, stop) positions of the sessions inside the range."""
+        start = np.searchsorted(self._sessions, self._to_day(start_date), side="left")
+        stop = np.searchsorted(self._sessions, self._to_day(end_date), side="right")
+        return int(start), int(stop)
+
+
+_calendars: "OrderedDict[tuple, TradingCalendar]" = OrderedDict()
+_calendars_lock = threading.Lock()
+_MAX_CALENDARS = 256
+
+
+def get_trading_calendar(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    source: Annotated[str, "label of the price data the calendar is built from"],
+    dates: Annotated[pd.DatetimeIndex, "trading dates of the price data"],
+) -> TradingCalendar:
+    """
+    Return the calendar for a symbol's price data, building it only once per
+    version of that data (identified by its length and last date).
+    """
+    key = (symbol.upper(), source, len(dates), dates[-1] if len(dates) else None)
+    with _calendars_lock:
+        calendar = _calendars.get(key)
+        if calendar is not None:
+            _calendars.move_to_end(key)
+            return calendar
+
+    calendar = TradingCalendar.from_dates(dates)
+    with _calendars_lock:
+        _calendars[key] = calendar
+        while len(_calendars) > _MAX_CALENDARS:
+            _calendars.popitem(last=False)
+    return calendar
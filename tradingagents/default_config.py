@@ -20,4 +20,33 @@ DEFAULT_CONFIG = {
     "max_recur_limit": 100,
     # Tool settings
     "online_tools": True,
+    # Data cache settings
+    "price_cache_max_mb": 512,
+    "price_cache_max_entries": 64,
+    "price_refresh_mode": "incremental",  # "incremental" or "full"
+    "price_history_years": 15,
+    "price_batch_size": 100,
+    "precompute_indicators": False,
+    "indicator_engine": "stockstats",  # "stockstats" or "numpy"
+    "finnhub_backend": "sqlite",  # "sqlite" or "json"
+    "finnhub_cache_max_entries": 128,
+    # Network settings
+    "http_pool_connections": 10,  # hosts kept in the shared session's pool
+    "http_pool_maxsize": 10,  # keep-alive connections per host
+    "http_timeout": 30,
+    "http_max_retries": 3,  # connection errors and 5xx responses
+    "openai_timeout": 600,
+    "openai_max_retries": 2,
+    "openai_cache": True,  # cache web-search tool responses in the result cache
+    "openai_cache_ttl": 3600,  # seconds, for searches as of today
+    # Google News scraper settings
+    "google_news_mode": "concurrent",  # "concurrent" or "serial"
+    "google_news_rate": 0.5,  # requests per second, shared by every query in the process
+    "google_news_burst": 2,
+    "google_news_concurrency": 4,
+    "google_news_prefetch_pages": 1,  # pages requested ahead; >1 may fetch past the last page
+    "google_news_url": "https://www.google.com/search",
+    "google_news_parser": "bs4",  # "bs4" or "parsel"
+    "google_news_cache": True,
+    "google_news_cache_ttl": 3600,  # seconds, for windows that include today
 }
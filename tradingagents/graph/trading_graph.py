@@ -113,9 +113,11 @@ class TradingAgentsGraph:
                     # online tools
                     self.toolkit.get_YFin_data_online,
                     self.toolkit.get_stockstats_indicators_report_online,
+                    self.toolkit.get_stockstats_indicators_batch_report_online,
                     # offline tools
                     self.toolkit.get_YFin_data,
                     self.toolkit.get_stockstats_indicators_report,
+                    self.toolkit.get_stockstats_indicators_batch_report,
                 ]
             ),
             "social": ToolNode(
@@ -141,6 +143,7 @@ class TradingAgentsGraph:
                     # online tools
                     self.toolkit.get_fundamentals_openai,
                     # offline tools
+                    self.toolkit.get_fundamentals_snapshot,
                     self.toolkit.get_finnhub_company_insider_sentiment,
                     self.toolkit.get_finnhub_company_insider_transactions,
                     self.toolkit.get_simfin_balance_sheet,